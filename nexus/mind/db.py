@@ -677,6 +677,19 @@ def via_route_get(id):
     return dict(row)
 
 
+def via_route_ids_like(prefix):
+    """IDs of Via routes equal to prefix or named prefix-<suffix>, as a set.
+
+    prefix must not contain GLOB metacharacters (slugs never do).
+    """
+    conn = _get_conn()
+    rows = conn.execute(
+        "SELECT id FROM via_routes WHERE id = ? OR id GLOB ?",
+        (prefix, prefix + "-*"),
+    ).fetchall()
+    return {r[0] for r in rows}
+
+
 def via_route_list():
     """List all Via routes."""
     conn = _get_conn()
@@ -706,26 +719,59 @@ def via_route_update(id, duration_ms=None, step_count=None):
         _maybe_commit(conn)
 
 
+# via_steps columns after (route_id, step_num), in via_step_insert() order.
+# The INSERT and every row tuple are built from this one list.
+_VIA_STEP_FIELDS = (
+    "ts_offset_ms", "event_type",
+    "x", "y", "rel_x", "rel_y", "window_x", "window_y", "window_w", "window_h",
+    "button", "key_code", "key_char", "modifiers", "ax_role", "ax_label",
+    "pid", "app_name",
+)
+_VIA_STEP_INSERT = (
+    f"INSERT INTO via_steps (route_id, step_num, {', '.join(_VIA_STEP_FIELDS)}) "
+    f"VALUES ({', '.join('?' * (len(_VIA_STEP_FIELDS) + 2))})"
+)
+
+
+def _via_step_row(route_id, step_num, step):
+    """Parameter tuple for _VIA_STEP_INSERT from a step dict."""
+    row = [route_id, step_num]
+    for field in _VIA_STEP_FIELDS:
+        value = step.get(field)
+        if field == "modifiers":
+            value = json.dumps(value) if value else None
+        row.append(value)
+    row[2] = row[2] or 0  # ts_offset_ms
+    return row
+
+
 def via_step_insert(route_id, step_num, ts_offset_ms, event_type,
                     x=None, y=None, rel_x=None, rel_y=None,
                     window_x=None, window_y=None, window_w=None, window_h=None,
                     button=None, key_code=None, key_char=None, modifiers=None,
                     ax_role=None, ax_label=None, pid=None, app_name=None):
     """Insert a Via step."""
+    step = locals()  # Argument names match _VIA_STEP_FIELDS
     conn = _get_conn()
-    mod_json = json.dumps(modifiers) if modifiers else None
     with _lock:
-        conn.execute(
-            "INSERT INTO via_steps "
-            "(route_id, step_num, ts_offset_ms, event_type, "
-            " x, y, rel_x, rel_y, window_x, window_y, window_w, window_h, "
-            " button, key_code, key_char, modifiers, ax_role, ax_label, pid, app_name) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (route_id, step_num, ts_offset_ms, event_type,
-             x, y, rel_x, rel_y, window_x, window_y, window_w, window_h,
-             button, key_code, key_char, mod_json, ax_role, ax_label, pid, app_name),
+        conn.execute(_VIA_STEP_INSERT, _via_step_row(route_id, step_num, step))
+        _maybe_commit(conn)
+
+
+def via_steps_insert_many(route_id, steps):
+    """Insert Via steps in one executemany, numbered from 1 in order.
+
+    Each step is a dict keyed like via_step_insert()'s arguments (minus
+    route_id/step_num). Returns the number of rows inserted.
+    """
+    conn = _get_conn()
+    with _lock:
+        cursor = conn.executemany(
+            _VIA_STEP_INSERT,
+            (_via_step_row(route_id, num, st) for num, st in enumerate(steps, 1)),
         )
         _maybe_commit(conn)
+        return cursor.rowcount
 
 
 def via_steps_for_route(route_id):
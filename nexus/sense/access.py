@@ -487,19 +487,29 @@ def element_at_position(x, y, pid=None):
     return _element_to_dict(el)
 
 
-def _element_to_dict(el, focused=False, content=False):
+_NODE_ATTRS = (
+    "AXRole", "AXRoleDescription", "AXTitle", "AXDescription",
+    "AXValue", "AXEnabled", "AXFocused", "AXPosition", "AXSize",
+)
+
+
+def _bulk_attrs(el):
+    """Fetch _NODE_ATTRS in one AX round-trip. Returns None on failure."""
+    try:
+        return el.get_multiple_attribute_values(*_NODE_ATTRS)
+    except Exception:
+        return None
+
+
+def _element_to_dict(el, focused=False, content=False, attrs=None):
     """Convert an AX element to a clean dict.
 
     Uses pyax's get_multiple_attribute_values for a single bulk API call
-    instead of 9 separate ax_attr() round-trips.
+    instead of 9 separate ax_attr() round-trips. Pass attrs when the
+    caller already fetched them with _bulk_attrs().
     """
-    try:
-        attrs = el.get_multiple_attribute_values(
-            "AXRole", "AXRoleDescription", "AXTitle", "AXDescription",
-            "AXValue", "AXEnabled", "AXFocused", "AXPosition", "AXSize",
-        )
-    except Exception:
-        attrs = {}
+    if attrs is None:
+        attrs = _bulk_attrs(el) or {}
 
     role = attrs.get("AXRole") or ""
     role_desc = attrs.get("AXRoleDescription") or ""
@@ -560,10 +570,16 @@ def walk_tree(element, max_depth=8, depth=0, max_elements=150,
         return []
 
     results = []
-    role = ax_attr(element, "AXRole") or ""
-    title = ax_attr(element, "AXTitle") or ""
-    desc = ax_attr(element, "AXDescription") or ""
-    label = title or desc
+    # One batched read serves both the filter below and _element_to_dict
+    attrs = _bulk_attrs(element)
+    if attrs is not None:
+        role = attrs.get("AXRole") or ""
+        label = attrs.get("AXTitle") or attrs.get("AXDescription") or ""
+    else:
+        role = ax_attr(element, "AXRole") or ""
+        title = ax_attr(element, "AXTitle") or ""
+        desc = ax_attr(element, "AXDescription") or ""
+        label = title or desc
 
     # Collect tables/lists for structured rendering (skip recursing into them)
     if _tables is not None and role == "AXTable":
@@ -582,7 +598,7 @@ def walk_tree(element, max_depth=8, depth=0, max_elements=150,
 
     # Include if interactive or has a label
     if role in INTERACTIVE_ROLES or label:
-        node = _element_to_dict(element)
+        node = _element_to_dict(element, attrs=attrs)
         # Skip noise: unlabeled static text, tiny elements
         if node["label"] or node["role"] not in ("static text", "image", "group"):
             if current_group:
@@ -669,6 +685,52 @@ def describe_app(pid=None, max_elements=150):
     return result
 
 
+def find_first(match, pid=None, max_elements=150):
+    """Return the first element whose (AXRole, label) satisfies match().
+
+    Visits nodes in the same order as describe_app() but stops at the first
+    hit instead of collecting the whole window. Only elements describe_app()
+    would list, and only those with an on-screen position, can match.
+
+    Args:
+        match: Callable (ax_role, label) -> bool.
+        pid: Process ID (default: frontmost app).
+        max_elements: Give up after this many listable elements, so the
+            search covers what describe_app(max_elements=...) returns.
+
+    Returns:
+        Element dict (as in describe_app) or None.
+    """
+    window, is_electron = _get_window(pid)
+    if not window:
+        return None
+
+    max_depth = 20 if is_electron else 8
+    stack = [(window, 0)]
+    listed = 0
+    while stack:
+        element, depth = stack.pop()
+        attrs = _bulk_attrs(element) or {}
+        role = attrs.get("AXRole") or ""
+        label = attrs.get("AXTitle") or attrs.get("AXDescription") or ""
+        if role in INTERACTIVE_ROLES or label:
+            if match(role, label):
+                node = _element_to_dict(element, attrs=attrs)
+                if node.get("pos"):
+                    return node
+            listed += 1
+            if listed >= max_elements:
+                return None
+        if depth < max_depth:
+            try:
+                children = list(element)
+            except Exception:
+                continue
+            # Reversed so the first child is popped first (pre-order)
+            stack.extend((child, depth + 1) for child in reversed(children))
+    return None
+
+
 def full_describe(pid=None, max_elements=150):
     """Single-pass tree walk returning elements, tables, and lists.
 
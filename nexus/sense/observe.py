@@ -9,7 +9,7 @@ Uses pyax for observer creation and notification management.
 Usage:
     start_observing(pid, app_name)  — begin watching an app
     stop_observing(pid)             — stop watching (or all if pid=None)
-    drain_events()                  — atomically drain the event buffer
+    drain_events()                  — drain the event buffer
     is_observing(pid)               — check if a PID is being observed
     status()                        — overview of all observers + buffer
 """
@@ -29,6 +29,7 @@ from CoreFoundation import (
     kCFRunLoopDefaultMode,
 )
 
+from nexus.mind.session import mark_dirty
 from nexus.sense.access import ax_attr, invalidate_cache
 
 
@@ -72,6 +73,8 @@ _MAX_EVENTS = 200
 # pid → {"observer": AXObserverRef, "app_name": str, "started": float}
 _observers = {}
 
+# Appended by the observer thread and popped by drain_events() without
+# _lock: deque append/popleft are atomic. _lock guards the other state.
 _event_buffer = deque(maxlen=_MAX_EVENTS)
 _lock = threading.Lock()
 
@@ -79,7 +82,8 @@ _thread = None
 _runloop = None          # set from within the observer thread
 _runloop_ready = None    # threading.Event, signaled when runloop is set
 
-# Debounce tracking: (pid, notification_type) → timestamp
+# Debounce tracking: (pid, notification_type) → time.monotonic(). Entries
+# for a pid are dropped when it stops being observed, so this stays bounded.
 _last_event = {}
 
 # Reverse lookup: id(observer) → pid
@@ -90,6 +94,24 @@ _observer_to_pid = {}
 # AXObserver callback
 # ---------------------------------------------------------------------------
 
+_SUMMARY_ATTRS = ("AXRole", "AXTitle", "AXDescription")
+
+
+def _role_and_label(element):
+    """(role, label) of an element in one AX round-trip when possible."""
+    try:
+        attrs = element.get_multiple_attribute_values(*_SUMMARY_ATTRS)
+    except Exception:
+        attrs = None
+    if isinstance(attrs, dict):
+        return (attrs.get("AXRole") or "",
+                attrs.get("AXTitle") or attrs.get("AXDescription") or "")
+    # Bulk read unavailable: fall back to one attribute at a time
+    role = ax_attr(element, "AXRole") or ""
+    title = ax_attr(element, "AXTitle") or ax_attr(element, "AXDescription") or ""
+    return role, title
+
+
 def _on_notification(observer, element, notification, info):
     """AXObserver callback — runs on the observer thread.
 
@@ -99,7 +121,6 @@ def _on_notification(observer, element, notification, info):
     Note: pyax's create_observer wraps this with the correct ObjC bridge
     decorator, so no @objc.callbackFor needed here.
     """
-    now = time.time()
     notif = str(notification)
 
     pid = _observer_to_pid.get(id(observer))
@@ -109,31 +130,30 @@ def _on_notification(observer, element, notification, info):
     # Debounce
     key = (pid, notif)
     window = _DEBOUNCE.get(notif, _DEBOUNCE_DEFAULT)
+    mono = time.monotonic()
     with _lock:
-        last = _last_event.get(key, 0)
-        if now - last < window:
+        last = _last_event.get(key)
+        if last is not None and mono - last < window:
             return
-        _last_event[key] = now
+        _last_event[key] = mono
+    now = time.time()
 
     # Extract role + label immediately (element may go stale after return)
-    role = ax_attr(element, "AXRole") or ""
-    title = ax_attr(element, "AXTitle") or ax_attr(element, "AXDescription") or ""
+    role, title = _role_and_label(element)
 
-    with _lock:
-        _event_buffer.append({
-            "ts": now,
-            "pid": pid,
-            "type": notif,
-            "role": role,
-            "label": title,
-        })
+    _event_buffer.append({
+        "ts": now,
+        "pid": pid,
+        "type": notif,
+        "role": role,
+        "label": title,
+    })
 
     # Invalidate tree cache so next see() gets fresh data
     invalidate_cache()
 
     # Mark spatial cache dirty for this PID
     try:
-        from nexus.mind.session import mark_dirty
         mark_dirty(pid)
     except Exception:
         pass
@@ -238,6 +258,8 @@ def stop_observing(pid=None):
             info = _observers.pop(p, None)
             if info:
                 _observer_to_pid.pop(id(info["observer"]), None)
+            for key in [k for k in _last_event if k[0] == p]:
+                del _last_event[key]
 
         if info and _runloop is not None:
             observer = info["observer"]
@@ -259,16 +281,21 @@ def stop_observing(pid=None):
 
 
 def drain_events():
-    """Atomically drain all buffered events. Returns list of event dicts.
+    """Drain all buffered events. Returns list of event dicts, oldest first.
 
     Called by see() to include pending events in output.
-    Also lazily cleans up observers for dead PIDs.
+    Also lazily cleans up observers for dead PIDs. Events appended while
+    draining are left for the next call.
     """
     _check_stale_observers()
 
-    with _lock:
-        events = list(_event_buffer)
-        _event_buffer.clear()
+    events = []
+    popleft = _event_buffer.popleft
+    try:
+        for _ in range(len(_event_buffer)):
+            events.append(popleft())
+    except IndexError:
+        pass  # A concurrent drain took the rest
     return events
 
 
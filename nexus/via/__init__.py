@@ -13,15 +13,35 @@ Usage:
     do("via delete gmail-login")  → remove a route
 """
 
-from nexus.via.recorder import (  # noqa: F401
-    start_recording,
-    stop_recording,
-    is_recording,
-    list_recordings,
-    get_recording,
-    delete_recording,
-)
-from nexus.via.player import replay  # noqa: F401
-from nexus.via.tap import shutdown  # noqa: F401
-from nexus.via.recipe import list_recipes  # noqa: F401
-from nexus.via.router import route  # noqa: F401
+import importlib
+
+# Public API → defining module. Resolved lazily (PEP 562) so that importing a
+# submodule like nexus.via.router — which do() does on every call — doesn't
+# drag in the CGEventTap and replay machinery (Quartz, AppKit, AX tree).
+_LAZY = {
+    "start_recording": "nexus.via.recorder",
+    "stop_recording": "nexus.via.recorder",
+    "is_recording": "nexus.via.recorder",
+    "list_recordings": "nexus.via.recorder",
+    "get_recording": "nexus.via.recorder",
+    "delete_recording": "nexus.via.recorder",
+    "replay": "nexus.via.player",
+    "shutdown": "nexus.via.tap",
+    "list_recipes": "nexus.via.recipe",
+    "route": "nexus.via.router",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache — next access skips __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
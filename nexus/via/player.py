@@ -14,6 +14,8 @@ Usage:
 """
 
 import time
+from dataclasses import dataclass
+from typing import Optional
 
 from Quartz import (
     CGWindowListCopyWindowInfo,
@@ -24,19 +26,57 @@ from Quartz import (
 
 from nexus.act import input as raw_input
 from nexus.mind import db
-from nexus.sense.access import describe_app
+from nexus.sense.access import find_first
+from nexus.sense.system import detect_system_dialogs
+
+
+# ---------------------------------------------------------------------------
+# Steps
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class Step:
+    """One recorded event (a via_steps row), converted once per replay."""
+    event_type: str = ""
+    ts_offset_ms: float = 0
+    x: Optional[int] = None
+    y: Optional[int] = None
+    rel_x: Optional[float] = None
+    rel_y: Optional[float] = None
+    window_x: Optional[int] = None
+    window_y: Optional[int] = None
+    window_w: Optional[int] = None
+    window_h: Optional[int] = None
+    button: Optional[str] = None
+    key_code: Optional[int] = None
+    key_char: Optional[str] = None
+    modifiers: Optional[dict] = None
+    ax_role: Optional[str] = None
+    ax_label: Optional[str] = None
+    pid: Optional[int] = None
+    app_name: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row):
+        """Build from a db.via_steps_for_route() dict (extra keys ignored)."""
+        return cls(**{k: row[k] for k in cls.__slots__ if k in row})
 
 
 # ---------------------------------------------------------------------------
 # Replay
 # ---------------------------------------------------------------------------
 
+_SETTLE_S = 0.05  # Minimum gap after a step before the next one starts
+
+
 def replay(route_id, speed=1.0, pid=None):
     """Replay a saved Via route.
 
     Args:
         route_id: ID of the route to replay.
-        speed: Timing multiplier (1.0 = original speed, 2.0 = 2x faster, 0 = no delays).
+        speed: Timing multiplier (1.0 = original speed, 2.0 = 2x faster,
+            0 = no delays at all, including the settle pauses around clicks;
+            the caller is then responsible for the UI keeping up).
         pid: Target app PID (optional, overrides recorded PID).
 
     Returns dict with results.
@@ -45,32 +85,44 @@ def replay(route_id, speed=1.0, pid=None):
     if not route:
         return {"ok": False, "error": f'Via route "{route_id}" not found'}
 
-    steps = db.via_steps_for_route(route_id)
+    steps = [Step.from_row(r) for r in db.via_steps_for_route(route_id)]
     if not steps:
         return {"ok": False, "error": f'Via route "{route_id}" has no steps'}
 
+    _force_dialog_check()
+
+    sleep = time.sleep if speed > 0 else _no_sleep
     results = []
     prev_offset = 0
+    due = time.monotonic()  # When the current step should start
+    settle_until = 0.0      # Earliest start allowed by the previous step's settle
 
     for i, step in enumerate(steps):
-        # Timing: respect original delays between events
+        # Timing: respect original delays between events. Deadlines are
+        # measured from the previous step's start, so the time a step takes
+        # to execute is absorbed into the recorded gap instead of added to it.
         if speed > 0 and i > 0:
-            delay = (step["ts_offset_ms"] - prev_offset) / 1000.0
+            delay = (step.ts_offset_ms - prev_offset) / 1000.0
             delay /= speed
             if delay > 0:
                 # Cap delay at 5s to avoid extremely long waits
-                time.sleep(min(delay, 5.0))
-        prev_offset = step["ts_offset_ms"]
+                due += min(delay, 5.0)
+            wait = max(due, settle_until) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            # Running late: re-anchor rather than bursting to catch up
+            due = max(due, time.monotonic())
+        prev_offset = step.ts_offset_ms
 
         # Check for system dialogs
         _handle_system_dialog()
 
         # Replay the event
-        event_type = step["event_type"]
+        event_type = step.event_type
         step_result = {"step": i + 1, "type": event_type}
 
         if event_type == "click":
-            result = _replay_click(step, pid=pid)
+            result = _replay_click(step, pid=pid, sleep=sleep)
         elif event_type == "key":
             result = _replay_key(step)
         elif event_type == "scroll":
@@ -95,9 +147,10 @@ def replay(route_id, speed=1.0, pid=None):
 
         results.append(step_result)
 
-        # Brief pause between steps for UI to settle
-        if i < len(steps) - 1:
-            time.sleep(0.05)
+        # Brief pause between steps for UI to settle (overlaps the next
+        # step's recorded delay; skipped entirely at speed=0)
+        if speed > 0:
+            settle_until = time.monotonic() + _SETTLE_S
 
     return {
         "ok": True,
@@ -113,39 +166,44 @@ def replay(route_id, speed=1.0, pid=None):
 # Click replay — 3-tier fallback
 # ---------------------------------------------------------------------------
 
-def _replay_click(step, pid=None):
+def _no_sleep(_seconds):
+    """Stand-in for time.sleep when replaying at speed=0."""
+
+
+def _replay_click(step, pid=None, sleep=time.sleep):
     """Replay a click event with 3-tier fallback.
 
     Tier 1: AX locator (find element by role+label, click at current position)
     Tier 2: Relative coordinates (compute from current window bounds)
     Tier 3: Absolute coordinates (original screen position)
     """
-    target_pid = pid or step.get("pid")
-    ax_role = step.get("ax_role")
-    ax_label = step.get("ax_label")
-    button = step.get("button", "left")
+    target_pid = pid or step.pid
+    ax_role = step.ax_role
+    ax_label = step.ax_label
+    button = step.button or "left"
+    modifiers = step.modifiers
 
     # Tier 1: AX locator — find element by role+label
     if ax_role and ax_label:
         pos = _find_element_position(ax_role, ax_label, target_pid)
         if pos:
-            _do_click(pos[0], pos[1], button, step.get("modifiers"))
+            _do_click(pos[0], pos[1], button, modifiers, sleep=sleep)
             return {"ok": True, "method": "ax_locator",
                     "target": f"{ax_label} ({ax_role.replace('AX', '')})"}
 
     # Tier 2: Relative coordinates
-    if step.get("rel_x") is not None and step.get("rel_y") is not None:
+    if step.rel_x is not None and step.rel_y is not None:
         abs_pos = _relative_to_absolute(step, target_pid)
         if abs_pos:
-            _do_click(abs_pos[0], abs_pos[1], button, step.get("modifiers"))
+            _do_click(abs_pos[0], abs_pos[1], button, modifiers, sleep=sleep)
             return {"ok": True, "method": "relative_coords",
                     "at": abs_pos}
 
     # Tier 3: Absolute coordinates (original position)
-    if step.get("x") is not None and step.get("y") is not None:
-        _do_click(step["x"], step["y"], button, step.get("modifiers"))
+    if step.x is not None and step.y is not None:
+        _do_click(step.x, step.y, button, modifiers, sleep=sleep)
         return {"ok": True, "method": "absolute_coords",
-                "at": (step["x"], step["y"])}
+                "at": (step.x, step.y)}
 
     return {"ok": False, "error": "No position data for click"}
 
@@ -156,19 +214,16 @@ def _find_element_position(ax_role, ax_label, pid=None):
     Returns (x, y) tuple or None.
     """
     try:
-        elements = describe_app(pid=pid, max_elements=200)
-        if not elements:
-            return None
-
-        for el in elements:
-            if el.get("_ax_role") == ax_role and el.get("label") == ax_label:
-                pos = el.get("pos")
-                size = el.get("size")
-                if pos and size:
-                    # Return center of element
-                    return (pos[0] + size[0] // 2, pos[1] + size[1] // 2)
-                elif pos:
-                    return pos
+        el = find_first(
+            lambda role, label: role == ax_role and label == ax_label,
+            pid=pid, max_elements=200)
+        if el:
+            pos = el["pos"]
+            size = el.get("size")
+            if size:
+                # Return center of element
+                return (pos[0] + size[0] // 2, pos[1] + size[1] // 2)
+            return pos
     except Exception:
         pass
     return None
@@ -179,50 +234,62 @@ def _relative_to_absolute(step, pid=None):
 
     Returns (x, y) tuple or None.
     """
-    rel_x = step["rel_x"]
-    rel_y = step["rel_y"]
+    rel_x = step.rel_x
+    rel_y = step.rel_y
 
     # Get current window bounds for the app
-    try:
-        # Try to find any window for this app
-        app_name = step.get("app_name")
-        if pid or app_name:
-            windows = CGWindowListCopyWindowInfo(
-                kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
-                kCGNullWindowID,
-            )
-            for w in windows:
-                wpid = w.get("kCGWindowOwnerPID")
-                wname = w.get("kCGWindowOwnerName", "")
-                if (pid and wpid == pid) or (app_name and wname == app_name):
-                    bounds = w.get("kCGWindowBounds")
-                    if bounds:
-                        wx = int(bounds.get("X", 0))
-                        wy = int(bounds.get("Y", 0))
-                        ww = int(bounds.get("Width", 0))
-                        wh = int(bounds.get("Height", 0))
-                        if ww > 0 and wh > 0:
-                            abs_x = int(wx + ww * rel_x)
-                            abs_y = int(wy + wh * rel_y)
-                            return (abs_x, abs_y)
-                    break
-    except Exception:
-        pass
+    app_name = step.app_name
+    if pid or app_name:
+        bounds = _window_bounds(pid, app_name)
+        if bounds:
+            wx, wy, ww, wh = bounds
+            abs_x = int(wx + ww * rel_x)
+            abs_y = int(wy + wh * rel_y)
+            return (abs_x, abs_y)
 
     # Fallback: use original window bounds from recording
-    if all(step.get(k) is not None for k in ("window_x", "window_y", "window_w", "window_h")):
-        abs_x = int(step["window_x"] + step["window_w"] * rel_x)
-        abs_y = int(step["window_y"] + step["window_h"] * rel_y)
+    if None not in (step.window_x, step.window_y, step.window_w, step.window_h):
+        abs_x = int(step.window_x + step.window_w * rel_x)
+        abs_y = int(step.window_y + step.window_h * rel_y)
         return (abs_x, abs_y)
 
     return None
 
 
-def _do_click(x, y, button="left", modifiers=None):
+def _window_bounds(pid, app_name):
+    """Current (x, y, w, h) of the app's first on-screen window, or None.
+
+    Not cached: a click, key or scroll between steps can move, resize or
+    zoom the window, and each step does a single lookup.
+    """
+    try:
+        windows = CGWindowListCopyWindowInfo(
+            kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
+            kCGNullWindowID,
+        )
+        for w in windows:
+            wpid = w.get("kCGWindowOwnerPID")
+            wname = w.get("kCGWindowOwnerName", "")
+            if (pid and wpid == pid) or (app_name and wname == app_name):
+                bounds = w.get("kCGWindowBounds")
+                if bounds:
+                    wx = int(bounds.get("X", 0))
+                    wy = int(bounds.get("Y", 0))
+                    ww = int(bounds.get("Width", 0))
+                    wh = int(bounds.get("Height", 0))
+                    if ww > 0 and wh > 0:
+                        return (wx, wy, ww, wh)
+                break
+    except Exception:
+        pass
+    return None
+
+
+def _do_click(x, y, button="left", modifiers=None, sleep=time.sleep):
     """Execute a click at (x, y) with optional modifiers."""
     # Move to position
     raw_input.move_to(x, y)
-    time.sleep(0.02)
+    sleep(0.02)
 
     # Determine modifier keys to hold
     mod_keys = []
@@ -242,6 +309,7 @@ def _do_click(x, y, button="left", modifiers=None):
         raw_input.modifier_click(x, y, mod_keys)
     else:
         raw_input.click(x, y)
+    _force_dialog_check()  # A click is what usually spawns a dialog
 
 
 # ---------------------------------------------------------------------------
@@ -250,9 +318,9 @@ def _do_click(x, y, button="left", modifiers=None):
 
 def _replay_key(step):
     """Replay a keyboard event."""
-    key_char = step.get("key_char", "")
-    key_code = step.get("key_code")
-    modifiers = step.get("modifiers", {})
+    key_char = step.key_char or ""
+    key_code = step.key_code
+    modifiers = step.modifiers or {}
 
     if not key_char and key_code is None:
         return {"ok": False, "error": "No key data"}
@@ -296,9 +364,9 @@ def _replay_key(step):
 
 def _replay_scroll(step):
     """Replay a scroll event."""
-    x = step.get("x", 0)
-    y = step.get("y", 0)
-    direction = step.get("button", "down")
+    x = step.x or 0
+    y = step.y or 0
+    direction = step.button or "down"
 
     clicks = 3 if direction == "down" else -3
     raw_input.scroll(clicks, x=x, y=y)
@@ -309,10 +377,28 @@ def _replay_scroll(step):
 # System dialog handling
 # ---------------------------------------------------------------------------
 
+_DIALOG_CHECK_INTERVAL = 0.5  # seconds between dialog scans
+_last_dialog_check = 0.0
+
+
+def _force_dialog_check():
+    """Make the next _handle_system_dialog() call scan regardless of timing."""
+    global _last_dialog_check
+    _last_dialog_check = 0.0
+
+
 def _handle_system_dialog():
-    """Check for and auto-dismiss system dialogs during replay."""
+    """Check for and auto-dismiss system dialogs during replay.
+
+    Scans at most every _DIALOG_CHECK_INTERVAL; clicks reset the timer.
+    """
+    global _last_dialog_check
+    now = time.monotonic()
+    if _last_dialog_check and now - _last_dialog_check < _DIALOG_CHECK_INTERVAL:
+        return
+    _last_dialog_check = now
+
     try:
-        from nexus.sense.system import detect_system_dialogs
         dialogs = detect_system_dialogs()
         if not dialogs:
             return
@@ -326,5 +412,6 @@ def _handle_system_dialog():
                 bx, by = coords[action]
                 raw_input.click(bx, by)
                 time.sleep(0.5)  # Wait for dialog to dismiss
+                _force_dialog_check()  # Dismissing one may reveal another
     except Exception:
         pass
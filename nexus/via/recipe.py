@@ -12,9 +12,13 @@ Usage:
         return applescript(f'set volume output volume {match.group(1)}')
 """
 
+import bisect
+import functools
 import re
 import subprocess
+import time
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Callable, Optional
 
 
@@ -25,13 +29,13 @@ from typing import Callable, Optional
 @dataclass
 class Recipe:
     name: str                  # "system.set_volume"
-    pattern: re.Pattern        # compiled regex
+    pattern: re.Pattern        # compiled regex (IGNORECASE | ASCII)
     handler: Callable          # fn(match, pid=None) → dict
     app: Optional[str]         # "mail", "finder", None = any app
     priority: int              # lower = tried first
 
 
-_registry: list[Recipe] = []
+_registry: list[Recipe] = []  # kept sorted by priority (stable) via insort
 _loaded: bool = False
 
 # Partitioned index: {app_key: [Recipe]} and None for global recipes.
@@ -39,23 +43,83 @@ _loaded: bool = False
 _by_app: dict[str | None, list[Recipe]] = {}
 _partitioned: bool = False
 
+# One compiled alternation per partition: {app_key: union pattern or None}.
+# A single regex-engine pass replaces a Python-level search() per recipe.
+_unions: dict[str | None, Optional[re.Pattern]] = {}
+
+# Partitions to try per frontmost app: {app_lower: [app_key, ..., None]}.
+# The app rarely changes between intents; cleared with the partition.
+_dispatch_cache: dict[str, list[str | None]] = {}
+
+# Read-only list_recipes() result; None until first asked or after registration.
+_list_cache: Optional[tuple] = None
+
+
+def _build_union(recipes):
+    """Compile a partition's patterns into one alternation, in priority order.
+
+    Alternative i is ``(?P<ri>(?s:.*?)(?:pattern_i))`` and the union is used
+    with .match(), so it succeeds iff pattern_i would succeed with search() —
+    and the regex engine tries alternatives left to right, so the first hit is
+    the highest-priority matching recipe. Returns None if the patterns can't
+    be combined (e.g. duplicate named groups); callers then scan one by one.
+    """
+    if not recipes:
+        return None
+    parts = [
+        f"(?P<r{i}>(?s:.*?)(?:{r.pattern.pattern}))"
+        for i, r in enumerate(recipes)
+    ]
+    try:
+        return re.compile("|".join(parts), recipes[0].pattern.flags)
+    except re.error:
+        return None
+
 
 def _rebuild_partition():
-    """Rebuild the app-partitioned index from the registry."""
+    """Rebuild the app-partitioned index (and its unions) from the registry."""
     global _partitioned
     _by_app.clear()
+    _unions.clear()
+    _dispatch_cache.clear()
     for r in _registry:
         _by_app.setdefault(r.app, []).append(r)
+    for app_key, recipes in _by_app.items():
+        _unions[app_key] = _build_union(recipes)
     _partitioned = True
 
 
+def _first_match(app_key, action):
+    """First recipe in one partition whose pattern matches (Recipe or None)."""
+    recipes = _by_app.get(app_key)
+    if not recipes:
+        return None
+    union = _unions.get(app_key)
+    if union is None:
+        for r in recipes:
+            if r.pattern.search(action):
+                return r
+        return None
+    m = union.match(action)
+    if m is None:
+        return None
+    return recipes[int(m.lastgroup[1:])]
+
+
+def _priority(r):
+    return r.priority
+
+
 def recipe(pattern, app=None, priority=50):
     """Decorator to register an intent recipe."""
     global _partitioned
-    compiled = re.compile(pattern, re.IGNORECASE)
+    # Intent patterns are plain ASCII; re.ASCII keeps IGNORECASE on the cheap
+    # ASCII case table instead of full Unicode case folding.
+    compiled = re.compile(pattern, re.IGNORECASE | re.ASCII)
 
     def decorator(fn):
-        global _partitioned
+        global _partitioned, _list_cache
+        _list_cache = None
         module = fn.__module__.rsplit(".", 1)[-1] if fn.__module__ else "unknown"
         name = f"{module}.{fn.__name__}"
         r = Recipe(
@@ -68,18 +132,44 @@ def recipe(pattern, app=None, priority=50):
         # Replace if already registered (handles module reload)
         for i, existing in enumerate(_registry):
             if existing.name == name:
-                _registry[i] = r
-                _registry.sort(key=lambda x: x.priority)
+                if existing.priority == priority:
+                    _registry[i] = r  # Same slot keeps order among equals
+                else:
+                    del _registry[i]
+                    bisect.insort(_registry, r, key=_priority)
                 _partitioned = False  # Invalidate partition
                 return fn
-        _registry.append(r)
-        _registry.sort(key=lambda x: x.priority)
+        # insort (right) lands after equal priorities, like append + stable sort
+        bisect.insort(_registry, r, key=_priority)
         _partitioned = False  # Invalidate partition
         return fn
 
     return decorator
 
 
+def _forget_module(module):
+    """Drop every recipe registered by one recipe module (before reloading it).
+
+    Without this, a recipe deleted or renamed in the file would survive reload.
+    Returns the registry as it was, for _restore_registry() if reload fails.
+    """
+    global _partitioned, _list_cache
+    prefix = f"{module}."
+    before = list(_registry)
+    _registry[:] = [r for r in before if not r.name.startswith(prefix)]
+    _partitioned = False
+    _list_cache = None
+    return before
+
+
+def _restore_registry(snapshot):
+    """Put back a registry saved by _forget_module() (reload failed)."""
+    global _partitioned, _list_cache
+    _registry[:] = snapshot
+    _partitioned = False
+    _list_cache = None
+
+
 # ---------------------------------------------------------------------------
 # Matching
 # ---------------------------------------------------------------------------
@@ -103,23 +193,24 @@ def match_recipe(action, pid=None, app_name=None):
 
     app_lower = app_name.lower() if app_name else ""
 
-    # Check app-specific recipes first, then global
-    candidates = []
-    if app_lower:
-        for app_key, recipes in _by_app.items():
-            if app_key and app_key in app_lower:
-                candidates.extend(recipes)
-    # Always include global recipes (app=None)
-    candidates.extend(_by_app.get(None, []))
-    # Sort by priority (partitions may interleave)
-    candidates.sort(key=lambda r: r.priority)
+    # Check app-specific partitions first, then global (app=None)
+    app_keys = _dispatch_cache.get(app_lower)
+    if app_keys is None:
+        app_keys = [k for k in _by_app if k and k in app_lower] if app_lower else []
+        app_keys.append(None)
+        _dispatch_cache[app_lower] = app_keys
 
-    for r in candidates:
-        m = r.pattern.search(action)
-        if m:
-            return r, m
+    # Best hit across partitions: lowest priority wins, earlier partition on ties
+    best = None
+    for app_key in app_keys:
+        r = _first_match(app_key, action)
+        if r is not None and (best is None or r.priority < best.priority):
+            best = r
 
-    return None, None
+    if best is None:
+        return None, None
+    # Re-run the recipe's own pattern so handlers see its group numbering
+    return best, best.pattern.search(action)
 
 
 def execute_recipe(rcp, match, pid=None):
@@ -131,20 +222,28 @@ def execute_recipe(rcp, match, pid=None):
         return {"ok": True, "result": str(result)}
     except Exception as e:
         return {"ok": False, "error": str(e)}
+    finally:
+        _invalidate_current_app()  # Recipes may quit, hide or activate apps
 
 
 def list_recipes():
-    """List all registered recipes."""
+    """List all registered recipes.
+
+    Returns a tuple of read-only mappings, built once per registry change.
+    """
+    global _list_cache
     _ensure_loaded()
-    return [
-        {
-            "name": r.name,
-            "pattern": r.pattern.pattern,
-            "app": r.app,
-            "priority": r.priority,
-        }
-        for r in _registry
-    ]
+    if _list_cache is None:
+        _list_cache = tuple(
+            MappingProxyType({
+                "name": r.name,
+                "pattern": r.pattern.pattern,
+                "app": r.app,
+                "priority": r.priority,
+            })
+            for r in _registry
+        )
+    return _list_cache
 
 
 # ---------------------------------------------------------------------------
@@ -161,14 +260,40 @@ def applescript(script):
     return {"ok": False, "error": result.get("stderr") or result.get("error", "AppleScript failed")}
 
 
-def cli(command, timeout=30):
-    """Run a shell command. Returns result dict."""
+_CLEAN_CHARS = " \t\r\n'\""
+
+
+def clean(s):
+    """Strip surrounding whitespace and quotes from a captured group."""
+    return s.strip(_CLEAN_CHARS)
+
+
+def osa_quote(s):
+    """Quote a string as an AppleScript string literal (quotes included).
+
+    Use for every user-supplied value spliced into a script, so a stray
+    quote or backslash can't break (or inject into) the script.
+    """
+    return '"' + s.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def cli(command, timeout=30, ok_codes=()):
+    """Run a command. Returns result dict.
+
+    Pass an argv list to exec the program directly (no /bin/sh, no quoting
+    issues with user input); a string still runs through the shell.
+    ok_codes: extra exit codes that still count as success when the command
+    printed something (e.g. du exits 1 on an unreadable subdirectory but
+    still prints the total).
+    """
     try:
         result = subprocess.run(
-            command, shell=True, capture_output=True, text=True, timeout=timeout,
+            command, shell=isinstance(command, str),
+            capture_output=True, text=True, timeout=timeout,
         )
-        if result.returncode == 0:
-            return {"ok": True, "result": result.stdout.strip()}
+        out = result.stdout.strip()
+        if result.returncode == 0 or (result.returncode in ok_codes and out):
+            return {"ok": True, "result": out}
         return {"ok": False, "error": result.stderr.strip() or f"exit code {result.returncode}"}
     except subprocess.TimeoutExpired:
         return {"ok": False, "error": f"Timed out after {timeout}s"}
@@ -176,28 +301,103 @@ def cli(command, timeout=30):
         return {"ok": False, "error": str(e)}
 
 
+def filter_output(result, pick):
+    """Post-process a successful cli() result (replaces shell pipes)."""
+    if result.get("ok"):
+        result["result"] = pick(result["result"])
+    return result
+
+
 def url_scheme(url):
     """Open a URL scheme (x-apple.systempreferences:, etc.)."""
-    return cli(f'open "{url}"')
+    return cli(["open", url])
+
+
+# Successful results of read-only recipes: {name: (expires_at, result)}
+_ttl_results: dict[str, tuple[float, dict]] = {}
+
+
+def ttl_cache(seconds):
+    """Reuse a read-only recipe's successful result for `seconds`.
+
+    Place below @recipe. The handler gains .invalidate() for recipes that
+    change the value (e.g. set_volume clears get_volume).
+    """
+    def decorator(fn):
+        key = f"{fn.__module__}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(m, pid=None):
+            hit = _ttl_results.get(key)
+            if hit and time.monotonic() < hit[0]:
+                return dict(hit[1])  # Callers annotate results in place
+            result = fn(m, pid=pid)
+            if isinstance(result, dict) and result.get("ok"):
+                _ttl_results[key] = (time.monotonic() + seconds, dict(result))
+            return result
+
+        wrapper.invalidate = lambda: _ttl_results.pop(key, None)
+        return wrapper
+
+    return decorator
 
 
 # ---------------------------------------------------------------------------
 # Internal
 # ---------------------------------------------------------------------------
 
+# Last _current_app() answer: (ts, pid, name). For the frontmost app the key
+# is the live frontmost pid, so an app switch is never answered from cache.
+_app_cache: tuple[float, Optional[int], str] = (0.0, None, "")
+_APP_CACHE_TTL = 1.0  # seconds
+
+
+def _invalidate_current_app():
+    """Forget the cached app name (call after anything that switches apps)."""
+    global _app_cache
+    _app_cache = (0.0, None, "")
+
+
 def _current_app(pid):
-    """Get app name for PID, or frontmost app name."""
-    if pid:
+    """Get app name for PID, or frontmost app name. Cached per pid for 1s."""
+    global _app_cache
+    front = None
+    if not pid:
+        front = _frontmost()
+        if front is None:
+            return ""
+        pid = front.processIdentifier()
+
+    ts, cached_pid, cached_name = _app_cache
+    now = time.monotonic()
+    if ts and cached_pid == pid and now - ts < _APP_CACHE_TTL:
+        return cached_name
+
+    name = _lookup_app(pid, front)
+    _app_cache = (now, pid, name)
+    return name
+
+
+def _frontmost():
+    """NSRunningApplication of the frontmost app, or None."""
+    try:
+        from AppKit import NSWorkspace
+        return NSWorkspace.sharedWorkspace().frontmostApplication()
+    except Exception:
+        return None
+
+
+def _lookup_app(pid, front=None):
+    """Uncached _current_app(). front: the frontmost app, if pid is its pid."""
+    if front is not None:
         try:
-            from nexus.sense.fusion import _app_info_for_pid
-            info = _app_info_for_pid(pid)
-            return info.get("name", "") if info else ""
+            return str(front.localizedName() or "")
         except Exception:
             return ""
     try:
-        from AppKit import NSWorkspace
-        front = NSWorkspace.sharedWorkspace().frontmostApplication()
-        return front.localizedName() if front else ""
+        from nexus.sense.fusion import _app_info_for_pid
+        info = _app_info_for_pid(pid)
+        return info.get("name", "") if info else ""
     except Exception:
         return ""
 
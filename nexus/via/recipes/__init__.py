@@ -4,12 +4,16 @@ import importlib
 import pkgutil
 import sys
 
+from nexus.via.recipe import _forget_module, _restore_registry
+
 
 def _load_all():
     """Import (or reload) all sibling modules to trigger @recipe registration.
 
     Only reloads modules that were already imported (i.e., on server restart).
-    Fresh imports don't need reload, saving 11 redundant import operations.
+    Fresh imports don't need reload, so a normal startup makes zero reload()
+    calls. A reloaded module's old recipes are dropped first so it registers
+    from a clean slate; if the reload fails they are put back.
     """
     package_path = __path__
     for _importer, module_name, _is_pkg in pkgutil.iter_modules(package_path):
@@ -21,7 +25,12 @@ def _load_all():
             mod = importlib.import_module(full)
             # Only reload if it was already imported (handles server restart / test reload)
             if already_loaded:
-                importlib.reload(mod)
+                snapshot = _forget_module(module_name)
+                try:
+                    importlib.reload(mod)
+                except Exception:
+                    _restore_registry(snapshot)  # Keep the last good recipes
+                    raise
         except Exception:
             pass  # Broken recipe file should never crash the system
 
@@ -1,21 +1,21 @@
 """App lifecycle recipes — force quit, hide, restart via AppleScript."""
 
-from nexus.via.recipe import recipe, applescript
+from nexus.via.recipe import recipe, applescript, osa_quote, clean
 
 
 @recipe(r"force quit (?:app )?(.+)")
 def force_quit(m, pid=None):
     """Force quit an application."""
-    app = m.group(1).strip().strip("'\"")
-    return applescript(f'tell app "{app}" to quit')
+    app = clean(m.group(1))
+    return applescript(f'tell app {osa_quote(app)} to quit')
 
 
 @recipe(r"hide (?:app )?(.+)")
 def hide_app(m, pid=None):
     """Hide an application."""
-    app = m.group(1).strip().strip("'\"")
+    app = clean(m.group(1))
     return applescript(
-        f'tell app "System Events" to set visible of process "{app}" to false'
+        f'tell app "System Events" to set visible of process {osa_quote(app)} to false'
     )
 
 
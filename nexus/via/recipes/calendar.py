@@ -1,6 +1,6 @@
 """Calendar.app recipes — create events, list events via AppleScript."""
 
-from nexus.via.recipe import recipe, applescript
+from nexus.via.recipe import recipe, applescript, osa_quote, clean
 
 
 @recipe(
@@ -9,13 +9,13 @@ from nexus.via.recipe import recipe, applescript
 )
 def create_event(m, pid=None):
     """Create a new calendar event in Calendar.app."""
-    title = m.group(1).strip().strip("'\"")
+    title = clean(m.group(1))
     when = m.group(2) or "today"
     return applescript(f'''
         tell application "Calendar"
             tell calendar 1
                 make new event with properties {{
-                    summary:"{title}",
+                    summary:{osa_quote(title)},
                     start date:(current date),
                     end date:((current date) + 3600)
                 }}
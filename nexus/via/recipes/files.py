@@ -1,27 +1,31 @@
 """File operation recipes — CLI-based file management."""
 
-from nexus.via.recipe import recipe, cli
+from nexus.via.recipe import recipe, cli, clean, filter_output
 
 
 @recipe(r"(?:find|search for|locate) files? (?:named? |called )?(.+?)(?:\s+in\s+(.+))?$")
 def find_files(m, pid=None):
     """Find files by name using Spotlight."""
-    name = m.group(1).strip().strip("'\"")
-    location = m.group(2).strip().strip("'\"") if m.group(2) else None
+    name = clean(m.group(1))
+    location = clean(m.group(2)) if m.group(2) else None
+    query = f"kMDItemDisplayName == *{name}*"
     if location:
-        return cli(f'mdfind -onlyin "{location}" "kMDItemDisplayName == *{name}*"')
-    return cli(f'mdfind "kMDItemDisplayName == *{name}*" | head -20')
+        return cli(["mdfind", "-onlyin", location, query])
+    return filter_output(cli(["mdfind", query]),
+                         lambda out: "\n".join(out.splitlines()[:20]))
 
 
 @recipe(r"^(?:disk |storage )?(?:usage|space)(?: (?:of|on|for)\s+(.+))?$")
 def disk_usage(m, pid=None):
     """Check disk usage."""
-    path = m.group(1).strip().strip("'\"") if m.group(1) else "/"
-    return cli(f'df -h "{path}" | tail -1')
+    path = clean(m.group(1)) if m.group(1) else "/"
+    return filter_output(cli(["df", "-h", path]),
+                         lambda out: out.splitlines()[-1] if out else out)
 
 
 @recipe(r"^(?:file |what is the )?size (?:of )?(.+)")
 def file_size(m, pid=None):
     """Get file or directory size."""
-    path = m.group(1).strip().strip("'\"")
-    return cli(f'du -sh "{path}" 2>/dev/null | cut -f1')
+    path = clean(m.group(1))
+    return filter_output(cli(["du", "-sh", path], ok_codes=(1,)),
+                         lambda out: out.split("\t", 1)[0])
@@ -1,6 +1,6 @@
 """Mail.app recipes — compose, check, count via AppleScript."""
 
-from nexus.via.recipe import recipe, applescript
+from nexus.via.recipe import recipe, applescript, osa_quote
 
 
 @recipe(
@@ -14,10 +14,10 @@ def compose_email(m, pid=None):
     script = f'''
         tell application "Mail"
             set msg to make new outgoing message with properties {{
-                visible:true, subject:"{subject}"
+                visible:true, subject:{osa_quote(subject)}
             }}
             tell msg
-                make new to recipient with properties {{address:"{to}"}}
+                make new to recipient with properties {{address:{osa_quote(to)}}}
             end tell
             activate
         end tell
@@ -1,6 +1,6 @@
 """Notes.app recipes — create, search, list via AppleScript."""
 
-from nexus.via.recipe import recipe, applescript
+from nexus.via.recipe import recipe, applescript, osa_quote, clean
 
 
 @recipe(
@@ -9,12 +9,12 @@ from nexus.via.recipe import recipe, applescript
 )
 def create_note(m, pid=None):
     """Create a new note in Notes.app."""
-    title = m.group(1).strip().strip("'\"")
+    title = clean(m.group(1))
     body = m.group(2) or ""
     return applescript(f'''
         tell application "Notes"
             make new note at folder "Notes" with properties {{
-                name:"{title}", body:"{body}"
+                name:{osa_quote(title)}, body:{osa_quote(body)}
             }}
             activate
         end tell
@@ -24,15 +24,15 @@ def create_note(m, pid=None):
 @recipe(r"(?:search|find) notes? (?:for |about |containing )?(.+)", app="notes")
 def search_notes(m, pid=None):
     """Search notes by keyword."""
-    query = m.group(1).strip().strip("'\"")
+    query = osa_quote(clean(m.group(1)))
     return applescript(f'''
         tell application "Notes"
-            set matches to every note whose name contains "{query}" or body contains "{query}"
+            set matches to every note whose name contains {query} or body contains {query}
             set result to ""
             repeat with n in matches
                 set result to result & name of n & linefeed
             end repeat
-            if result is "" then return "No notes found for: {query}"
+            if result is "" then return "No notes found for: " & {query}
             return result
         end tell
     ''')
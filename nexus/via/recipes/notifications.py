@@ -1,22 +1,22 @@
 """Notification recipes — richer patterns for osascript notifications and TTS."""
 
-from nexus.via.recipe import recipe, applescript
+from nexus.via.recipe import recipe, applescript, osa_quote, clean
 
 
 @recipe(r"(?:show )?notification\s+(.+?)(?:\s+(?:with title|titled)\s+(.+))?$")
 def notify(m, pid=None):
     """Show a macOS notification."""
-    message = m.group(1).strip().strip("'\"")
-    title = m.group(2).strip().strip("'\"") if m.group(2) else "Nexus"
+    message = clean(m.group(1))
+    title = clean(m.group(2)) if m.group(2) else "Nexus"
     return applescript(
-        f'display notification "{message}" with title "{title}"'
+        f'display notification {osa_quote(message)} with title {osa_quote(title)}'
     )
 
 
 @recipe(r"(?:alert|dialog)\s+(.+)")
 def alert(m, pid=None):
     """Show a modal alert dialog."""
-    message = m.group(1).strip().strip("'\"")
+    message = clean(m.group(1))
     return applescript(
-        f'display dialog "{message}" with title "Nexus" buttons {{"OK"}} default button "OK"'
+        f'display dialog {osa_quote(message)} with title "Nexus" buttons {{"OK"}} default button "OK"'
     )
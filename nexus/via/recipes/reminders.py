@@ -1,6 +1,6 @@
 """Reminders.app recipes — add, complete, list via AppleScript."""
 
-from nexus.via.recipe import recipe, applescript
+from nexus.via.recipe import recipe, applescript, osa_quote, clean
 
 
 @recipe(
@@ -9,10 +9,10 @@ from nexus.via.recipe import recipe, applescript
 )
 def add_reminder(m, pid=None):
     """Add a reminder to Reminders.app."""
-    title = m.group(1).strip().strip("'\"")
+    title = clean(m.group(1))
     return applescript(f'''
         tell application "Reminders"
-            make new reminder with properties {{name:"{title}"}}
+            make new reminder with properties {{name:{osa_quote(title)}}}
         end tell
     ''')
 
@@ -36,15 +36,15 @@ def list_reminders(m, pid=None):
 @recipe(r"(?:complete|finish|done|check off) reminder (.+)", app="reminders")
 def complete_reminder(m, pid=None):
     """Mark a reminder as complete."""
-    name = m.group(1).strip().strip("'\"")
+    name = osa_quote(clean(m.group(1)))
     return applescript(f'''
         tell application "Reminders"
-            set items to (reminders of default list whose name contains "{name}" and completed is false)
+            set items to (reminders of default list whose name contains {name} and completed is false)
             if (count of items) > 0 then
                 set completed of item 1 of items to true
                 return "Completed: " & name of item 1 of items
             else
-                return "No matching reminder found: {name}"
+                return "No matching reminder found: " & {name}
             end if
         end tell
     ''')
@@ -1,18 +1,18 @@
 """Safari recipes — navigation and tab management via AppleScript."""
 
-from nexus.via.recipe import recipe, applescript
+from nexus.via.recipe import recipe, applescript, osa_quote, clean
 
 
 @recipe(r"(?:go to|open|navigate to|visit|browse to)\s+(.+)", app="safari")
 def navigate(m, pid=None):
     """Navigate Safari to a URL."""
-    url = m.group(1).strip().strip("'\"")
+    url = clean(m.group(1))
     if not url.startswith(("http://", "https://", "file://", "about:")):
         url = f"https://{url}"
     return applescript(f'''
         tell application "Safari"
             if (count of windows) = 0 then make new document
-            set URL of front document to "{url}"
+            set URL of front document to {osa_quote(url)}
             activate
         end tell
     ''')
@@ -21,13 +21,13 @@ def navigate(m, pid=None):
 @recipe(r"new tab(?:\s+(.+))?", app="safari")
 def new_tab(m, pid=None):
     """Open a new Safari tab, optionally with a URL."""
-    url = m.group(1).strip().strip("'\"") if m.group(1) else "about:blank"
+    url = clean(m.group(1)) if m.group(1) else "about:blank"
     if url != "about:blank" and not url.startswith(("http://", "https://")):
         url = f"https://{url}"
     return applescript(f'''
         tell application "Safari"
             tell front window
-                set current tab to (make new tab with properties {{URL:"{url}"}})
+                set current tab to (make new tab with properties {{URL:{osa_quote(url)}}})
             end tell
         end tell
     ''')
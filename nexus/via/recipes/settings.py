@@ -1,5 +1,7 @@
 """System Settings recipes — open panes via URL schemes."""
 
+import re
+
 from nexus.via.recipe import recipe, url_scheme
 
 
@@ -42,16 +44,31 @@ _PANE_URLS = {
 }
 
 
+def _partial_match(pane):
+    """URL of the first pane whose name contains pane, or is contained in it."""
+    for key, val in _PANE_URLS.items():
+        if pane in key or key in pane:
+            return val
+    return None
+
+
+# Each word of a known pane name ("scanners", "items", ...), pre-resolved with
+# the same partial-match rule so common lookups skip the scan.
+_PANE_TOKENS = {
+    token: _partial_match(token)
+    for key in _PANE_URLS
+    for token in re.split(r"[\s&-]+", key)
+    if token
+}
+
+_KNOWN = ", ".join(sorted(_PANE_URLS))
+
+
 @recipe(r"(?:open )?(?:system )?settings?\s+(?:for\s+)?(.+)")
 def open_settings(m, pid=None):
     """Open a System Settings pane by name."""
-    pane = m.group(1).lower().strip()
-    url = _PANE_URLS.get(pane)
+    pane = m.group(1).strip().lower()
+    url = _PANE_URLS.get(pane) or _PANE_TOKENS.get(pane) or _partial_match(pane)
     if url:
         return url_scheme(url)
-    # Try partial match
-    for key, val in _PANE_URLS.items():
-        if pane in key or key in pane:
-            return url_scheme(val)
-    known = ", ".join(sorted(_PANE_URLS.keys()))
-    return {"ok": False, "error": f"Unknown pane: {pane}. Known: {known}"}
+    return {"ok": False, "error": f"Unknown pane: {pane}. Known: {_KNOWN}"}
@@ -1,16 +1,22 @@
 """System control recipes — volume, mute, dark mode, lock, sleep, screenshot, permissions."""
 
-from nexus.via.recipe import recipe, applescript, cli
+import re
+import time
+
+from nexus.mind.permissions import check_permissions
+from nexus.via.recipe import recipe, applescript, cli, ttl_cache, filter_output
 
 
 @recipe(r"set volume (?:to )?(\d+)")
 def set_volume(m, pid=None):
     """Set system volume (0-100)."""
     level = min(100, max(0, int(m.group(1))))
+    get_volume.invalidate()
     return applescript(f"set volume output volume {level}")
 
 
 @recipe(r"(?:get |check )?(?:current )?volume")
+@ttl_cache(3)
 def get_volume(m, pid=None):
     """Get current volume level."""
     return applescript("output volume of (get volume settings)")
@@ -36,45 +42,64 @@ def toggle_dark_mode(m, pid=None):
 @recipe(r"(?:lock|lock screen|lock display)")
 def lock_screen(m, pid=None):
     """Lock the screen."""
-    return cli(
-        "/System/Library/CoreServices/Menu\\ Extras/User.menu"
-        "/Contents/Resources/CGSession -suspend"
-    )
+    return cli([
+        "/System/Library/CoreServices/Menu Extras/User.menu"
+        "/Contents/Resources/CGSession",
+        "-suspend",
+    ])
 
 
 @recipe(r"(?:sleep|sleep display|display sleep)")
 def sleep_display(m, pid=None):
     """Put display to sleep."""
-    return cli("pmset displaysleepnow")
+    return cli(["pmset", "displaysleepnow"])
 
 
 @recipe(r"(?:take )?screenshot(?: (?:of )?(?:the )?(.+))?")
 def screenshot(m, pid=None):
     """Take a screenshot. Optional region/window target."""
-    import time
-    path = f"/tmp/screenshot-{int(time.time())}.png"
+    path = f"/tmp/screenshot-{time.time_ns()}.png"
     target = m.group(1)
     if target and target.strip().lower() in ("screen", "full", "desktop"):
         target = None
     if target:
         # Delegate to screencapture interactive if target specified
-        return cli(f"screencapture -x -i {path}")
-    return cli(f"screencapture -x {path}")
+        return cli(["screencapture", "-x", "-i", path])
+    return cli(["screencapture", "-x", path])
+
+
+_PERCENT_RE = re.compile(r"\d+%")
+
+
+def _ssid(out):
+    """Pick the SSID value out of `airport -I` output."""
+    for line in out.splitlines():
+        key, _, value = line.strip().partition(": ")
+        if key == "SSID":
+            return value
+    return ""
 
 
 @recipe(r"(?:get |what is (?:the )?)?battery (?:level|status|percentage|%)")
+@ttl_cache(3)
 def battery_status(m, pid=None):
     """Get battery percentage."""
-    return cli("pmset -g batt | grep -o '[0-9]*%'")
+    result = filter_output(cli(["pmset", "-g", "batt"]),
+                           lambda out: "\n".join(_PERCENT_RE.findall(out)))
+    if result.get("ok") and not result["result"]:
+        return {"ok": False, "error": "no battery"}  # Desktop Mac: let the GUI path try
+    return result
 
 
 @recipe(r"(?:get |check )?wifi (?:name|ssid|network)")
+@ttl_cache(3)
 def wifi_name(m, pid=None):
     """Get current Wi-Fi network name."""
-    return cli(
+    return filter_output(cli([
         "/System/Library/PrivateFrameworks/Apple80211.framework"
-        "/Resources/airport -I | awk '/ SSID:/{print $2}'"
-    )
+        "/Resources/airport",
+        "-I",
+    ]), _ssid)
 
 
 @recipe(r"(?:set )?brightness (?:to )?(\d+)")
@@ -91,7 +116,5 @@ def set_brightness(m, pid=None):
 @recipe(r"^(?:check |show |get )?permissions?(?: status)?$")
 def check_permissions_recipe(m, pid=None):
     """Check Nexus permission status."""
-    from nexus.mind.permissions import check_permissions
-
     result = check_permissions()
     return {"ok": True, "result": result["summary"], "text": result["summary"]}
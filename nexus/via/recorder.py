@@ -26,22 +26,46 @@ from nexus.via import tap
 _recording = None  # {"id": str, "name": str, "app": str, "started": float}
 
 
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
 def _slugify(name):
     """Convert 'Login to Gmail' to 'login-to-gmail'."""
-    slug = re.sub(r'[^a-z0-9]+', '-', name.lower().strip()).strip('-')
+    slug = _SLUG_RE.sub('-', name.lower().strip()).strip('-')
     return slug or "unnamed"
 
 
 def _unique_slug(base):
     """Ensure slug doesn't collide with existing route IDs."""
+    taken = db.via_route_ids_like(base)
     slug = base
     n = 2
-    while db.via_route_get(slug) is not None:
+    while slug in taken:
         slug = f"{base}-{n}"
         n += 1
     return slug
 
 
+_PREVIEW_STEPS = 20  # Steps listed in the stop_recording() preview
+
+
+def _preview_line(num, etype, ev):
+    """One line of the captured-steps preview, or None for unknown types."""
+    if etype == "click":
+        label = ev.get("ax_label", "")
+        role = (ev.get("ax_role") or "").replace("AX", "")
+        target = f' "{label}" ({role})' if label else f" at ({ev.get('x')}, {ev.get('y')})"
+        rel = ""
+        if ev.get("rel_x") is not None:
+            rel = f" [rel {ev['rel_x']:.2f}, {ev['rel_y']:.2f}]"
+        return f"  {num}. {ev.get('button', 'left')} click{target}{rel}"
+    if etype == "key":
+        return f"  {num}. key: {ev.get('key_char', '?')}"
+    if etype == "scroll":
+        return f"  {num}. scroll {ev.get('button', '?')}"
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Recording API
 # ---------------------------------------------------------------------------
@@ -88,81 +112,57 @@ def stop_recording():
     route_id = _recording["id"]
     elapsed = time.time() - _recording["started"]
 
-    # Stop tap and get raw events
-    events = tap.stop_tap()
-
-    # Filter noise: only keep click, key, scroll events that have event_type
-    events = [e for e in events if e.get("event_type")]
-
-    # Store events to DB
-    for i, ev in enumerate(events):
-        db.via_step_insert(
-            route_id=route_id,
-            step_num=i + 1,
-            ts_offset_ms=ev.get("ts_offset_ms", 0),
-            event_type=ev["event_type"],
-            x=ev.get("x"),
-            y=ev.get("y"),
-            rel_x=ev.get("rel_x"),
-            rel_y=ev.get("rel_y"),
-            window_x=ev.get("window_x"),
-            window_y=ev.get("window_y"),
-            window_w=ev.get("window_w"),
-            window_h=ev.get("window_h"),
-            button=ev.get("button"),
-            key_code=ev.get("key_code"),
-            key_char=ev.get("key_char"),
-            modifiers=ev.get("modifiers"),
-            ax_role=ev.get("ax_role"),
-            ax_label=ev.get("ax_label"),
-            pid=ev.get("pid"),
-            app_name=ev.get("app_name"),
-        )
-
-    # Update route metadata
-    db.via_route_update(route_id, duration_ms=elapsed * 1000, step_count=len(events))
+    # Single pass over the raw events: filter noise (only keep events that
+    # have an event_type), count per type and build the preview.
+    counts = {"click": 0, "key": 0, "scroll": 0}
+    step_lines = []
+    steps = []
+    for ev in tap.stop_tap():
+        etype = ev.get("event_type")
+        if not etype:
+            continue
+        steps.append(ev)
+        n = len(steps)
+        if etype in counts:
+            counts[etype] += 1
+        if n <= _PREVIEW_STEPS:
+            line = _preview_line(n, etype, ev)
+            if line:
+                step_lines.append(line)
+    n = len(steps)
+
+    # Store steps and route metadata in one transaction
+    with db.batch():
+        db.via_steps_insert_many(route_id, steps)
+        db.via_route_update(route_id, duration_ms=elapsed * 1000, step_count=n)
 
     result = {
         "ok": True,
         "action": "via_record_stop",
         "id": route_id,
         "name": _recording["name"],
-        "steps": len(events),
+        "steps": n,
         "duration_s": round(elapsed, 1),
     }
 
     # Summarize what was captured
-    clicks = sum(1 for e in events if e.get("event_type") == "click")
-    keys = sum(1 for e in events if e.get("event_type") == "key")
-    scrolls = sum(1 for e in events if e.get("event_type") == "scroll")
     parts = []
-    if clicks:
-        parts.append(f"{clicks} clicks")
-    if keys:
-        parts.append(f"{keys} keys")
-    if scrolls:
-        parts.append(f"{scrolls} scrolls")
+    if counts["click"]:
+        parts.append(f"{counts['click']} clicks")
+    if counts["key"]:
+        parts.append(f"{counts['key']} keys")
+    if counts["scroll"]:
+        parts.append(f"{counts['scroll']} scrolls")
     if parts:
         result["summary"] = ", ".join(parts)
 
+    reenables = tap.reenable_count()
+    if reenables:
+        result["tap_reenabled"] = reenables  # Events may be missing around these
+
     # Show captured steps
-    step_lines = []
-    for i, ev in enumerate(events[:20]):  # Show first 20
-        etype = ev["event_type"]
-        if etype == "click":
-            label = ev.get("ax_label", "")
-            role = (ev.get("ax_role") or "").replace("AX", "")
-            target = f' "{label}" ({role})' if label else f" at ({ev.get('x')}, {ev.get('y')})"
-            rel = ""
-            if ev.get("rel_x") is not None:
-                rel = f" [rel {ev['rel_x']:.2f}, {ev['rel_y']:.2f}]"
-            step_lines.append(f"  {i+1}. {ev.get('button', 'left')} click{target}{rel}")
-        elif etype == "key":
-            step_lines.append(f"  {i+1}. key: {ev.get('key_char', '?')}")
-        elif etype == "scroll":
-            step_lines.append(f"  {i+1}. scroll {ev.get('button', '?')}")
-    if len(events) > 20:
-        step_lines.append(f"  ... and {len(events) - 20} more")
+    if n > _PREVIEW_STEPS:
+        step_lines.append(f"  ... and {n - _PREVIEW_STEPS} more")
     if step_lines:
         result["steps_preview"] = "\n".join(step_lines)
 
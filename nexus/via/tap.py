@@ -11,11 +11,15 @@ Follows the same background-thread + CFRunLoop pattern as observe.py.
 Usage:
     start_tap()   — begin capturing input events
     stop_tap()    — stop and return all captured events
-    drain_events() — atomically drain buffer without stopping
+    drain_events() — drain buffer without stopping
+    reenable_count() — times the tap was disabled by macOS and re-enabled
     is_tapping()  — check if tap is active
 """
 
+import ctypes
+import functools
 import json
+import queue
 import threading
 import time
 from collections import deque
@@ -28,7 +32,9 @@ from Quartz import (
     CGEventGetFlags,
     CGEventGetIntegerValueField,
     CFMachPortCreateRunLoopSource,
+    CFMachPortInvalidate,
     CFRunLoopAddSource,
+    CFRunLoopRemoveSource,
     CFRunLoopGetCurrent,
     CFRunLoopRunInMode,
     CFRunLoopStop,
@@ -41,6 +47,8 @@ from Quartz import (
     kCGEventOtherMouseDown,
     kCGEventKeyDown,
     kCGEventScrollWheel,
+    kCGEventTapDisabledByTimeout,
+    kCGEventTapDisabledByUserInput,
     kCGWindowListOptionOnScreenOnly,
     kCGWindowListExcludeDesktopElements,
     kCGNullWindowID,
@@ -89,18 +97,41 @@ _MODIFIER_KEYCODES = {55, 56, 57, 58, 59, 60, 61, 62, 63}
 
 _MAX_EVENTS = 5000
 
+# Single writer (the enricher) appends, readers popleft: both are atomic
+# deque operations, so the buffer itself needs no lock. _lock only guards
+# the start/stop lifecycle.
 _event_buffer = deque(maxlen=_MAX_EVENTS)
 _lock = threading.Lock()
 
+# Raw events waiting for enrichment, in arrival order. The tap callback only
+# enqueues; _enrich_loop does the slow AX/window lookups off the tap thread.
+_pending = queue.SimpleQueue()
+_enricher = None
+# Set when stop gives up waiting: queued events then go to the buffer without
+# AX lookups, so a hung app delays stop by one AX timeout, not one per click.
+_enrich_skip = threading.Event()
+_ENRICH_GRACE = 3.0  # seconds stop waits for full enrichment
+
 _thread = None
 _runloop = None
+_tap_port = None  # The CGEventTap mach port while _tap_loop runs
+_tap_reenables = 0  # Times macOS disabled the tap and we turned it back on
 _runloop_ready = None
 _stop_flag = threading.Event()
-_recording_start = None  # time.time() when recording started
+_recording_start = None  # time.monotonic_ns() when recording started
+
+# Cached frontmost app info. The pid is re-checked every _FRONT_APP_TTL
+# (ts is time.monotonic()); the name is only re-read when the pid changes.
+_front_app_cache = {"pid": None, "name": None, "ts": 0.0}
+_FRONT_APP_TTL = 0.5
+_workspace = None  # NSWorkspace.sharedWorkspace(), fetched on first lookup
 
-# Cached frontmost app info (refreshed on each event)
-_front_app_cache = {"pid": None, "name": None, "ts": 0}
-_FRONT_APP_TTL = 0.5  # refresh every 500ms
+# On-screen window list as (pid, x, y, w, h) tuples, shared by clicks that
+# land within _WIN_CACHE_TTL of each other (CGWindowList is a WindowServer
+# round-trip, too slow to repeat on every click of a burst). by_pid holds the
+# same tuples grouped per owner, front-to-back like the full list.
+_win_cache = {"ts": 0.0, "windows": (), "by_pid": {}}
+_WIN_CACHE_TTL = 0.25  # seconds
 
 
 # ---------------------------------------------------------------------------
@@ -109,64 +140,100 @@ _FRONT_APP_TTL = 0.5  # refresh every 500ms
 
 def _get_front_app():
     """Get frontmost app PID and name (cached with short TTL)."""
-    now = time.time()
+    now = time.monotonic()
     if now - _front_app_cache["ts"] < _FRONT_APP_TTL and _front_app_cache["pid"]:
         return _front_app_cache["pid"], _front_app_cache["name"]
 
+    global _workspace
     try:
-        ws = NSWorkspace.sharedWorkspace()
-        front = ws.frontmostApplication()
+        if _workspace is None:
+            _workspace = NSWorkspace.sharedWorkspace()
+        front = _workspace.frontmostApplication()
         if front:
             pid = front.processIdentifier()
-            name = str(front.localizedName() or "")
-            _front_app_cache["pid"] = pid
-            _front_app_cache["name"] = name
+            if pid != _front_app_cache["pid"]:
+                _front_app_cache["name"] = str(front.localizedName() or "")
+                _front_app_cache["pid"] = pid
             _front_app_cache["ts"] = now
-            return pid, name
+            return pid, _front_app_cache["name"]
     except Exception:
         pass
     return _front_app_cache["pid"], _front_app_cache["name"]
 
 
-def _get_modifiers(flags):
-    """Extract modifier state from CGEvent flags."""
+_MODIFIER_MASK = (
+    kCGEventFlagMaskCommand | kCGEventFlagMaskShift
+    | kCGEventFlagMaskControl | kCGEventFlagMaskAlternate
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _modifiers_for(mask):
     return {
-        "cmd": bool(flags & kCGEventFlagMaskCommand),
-        "shift": bool(flags & kCGEventFlagMaskShift),
-        "ctrl": bool(flags & kCGEventFlagMaskControl),
-        "opt": bool(flags & kCGEventFlagMaskAlternate),
+        "cmd": bool(mask & kCGEventFlagMaskCommand),
+        "shift": bool(mask & kCGEventFlagMaskShift),
+        "ctrl": bool(mask & kCGEventFlagMaskControl),
+        "opt": bool(mask & kCGEventFlagMaskAlternate),
     }
 
 
-def _find_window_at(x, y, pid=None):
-    """Find the window containing point (x, y). Returns bounds dict or None.
+def _get_modifiers(flags):
+    """Extract modifier state from CGEvent flags.
 
-    Returns {"x": int, "y": int, "w": int, "h": int} for the matching window.
+    The dict is shared by every event with the same modifiers (there are
+    only 16 combinations) — treat it as read-only.
     """
+    return _modifiers_for(flags & _MODIFIER_MASK)
+
+
+def _on_screen_windows(pid=None):
+    """On-screen windows as (pid, x, y, w, h), cached for _WIN_CACHE_TTL.
+
+    With a pid, only that process's windows are returned.
+    """
+    now = time.monotonic()
+    if now - _win_cache["ts"] >= _WIN_CACHE_TTL:
+        _refresh_windows(now)
+    if pid:
+        return _win_cache["by_pid"].get(pid, ())
+    return _win_cache["windows"]
+
+
+def _refresh_windows(now):
+    windows = []
+    by_pid = {}
     try:
-        windows = CGWindowListCopyWindowInfo(
+        for w in CGWindowListCopyWindowInfo(
             kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
             kCGNullWindowID,
-        )
-        if not windows:
-            return None
-
-        for w in windows:
-            if pid and w.get("kCGWindowOwnerPID") != pid:
-                continue
+        ) or ():
             bounds = w.get("kCGWindowBounds")
             if not bounds:
                 continue
-            wx = int(bounds.get("X", 0))
-            wy = int(bounds.get("Y", 0))
             ww = int(bounds.get("Width", 0))
             wh = int(bounds.get("Height", 0))
             if ww <= 0 or wh <= 0:
                 continue
-            if wx <= x <= wx + ww and wy <= y <= wy + wh:
-                return {"x": wx, "y": wy, "w": ww, "h": wh}
+            win = (w.get("kCGWindowOwnerPID"),
+                   int(bounds.get("X", 0)), int(bounds.get("Y", 0)), ww, wh)
+            windows.append(win)
+            by_pid.setdefault(win[0], []).append(win)
     except Exception:
-        pass
+        # Don't cache failures; drop the stale list so callers see no windows
+        _win_cache.update(ts=0.0, windows=(), by_pid={})
+        return
+
+    _win_cache.update(ts=now, windows=windows, by_pid=by_pid)
+
+
+def _find_window_at(x, y, pid=None):
+    """Find the window containing point (x, y). Returns bounds dict or None.
+
+    Returns {"x": int, "y": int, "w": int, "h": int} for the matching window.
+    """
+    for _, wx, wy, ww, wh in _on_screen_windows(pid):
+        if wx <= x <= wx + ww and wy <= y <= wy + wh:
+            return {"x": wx, "y": wy, "w": ww, "h": wh}
     return None
 
 
@@ -198,6 +265,12 @@ def _key_char(key_code, modifiers):
     return "+".join(parts)
 
 
+@functools.lru_cache(maxsize=1024)
+def _key_char_for(key_code, mask):
+    """_key_char memoized on (key code, modifier mask) for the tap callback."""
+    return _key_char(key_code, _modifiers_for(mask))
+
+
 # ---------------------------------------------------------------------------
 # CGEventTap callback
 # ---------------------------------------------------------------------------
@@ -205,23 +278,35 @@ def _key_char(key_code, modifiers):
 def _on_event(proxy, etype, event, refcon):
     """CGEventTap callback — runs on the tap thread.
 
-    Extracts event data, enriches with AX hit-test and window bounds,
-    appends to the shared buffer. Returns event unchanged (listen-only).
+    Extracts raw event data and queues it for _enrich_loop, so the callback
+    never waits on another app's AX server. Returns event unchanged
+    (listen-only).
     """
-    if _recording_start is None:
+    global _tap_reenables
+    if etype in (kCGEventTapDisabledByTimeout, kCGEventTapDisabledByUserInput):
+        # macOS switched the tap off; we're on the tap's run loop thread, so
+        # turn it straight back on or the recording silently stops.
+        if _tap_port is not None:
+            CGEventTapEnable(_tap_port, True)
+            _tap_reenables += 1
         return event
 
-    now = time.time()
-    ts_offset = (now - _recording_start) * 1000.0  # ms
+    start = _recording_start  # Read once: stop_tap may clear it meanwhile
+    if start is None:
+        return event
+
+    # Integer ns → ms, truncated to 0.1ms
+    ts_offset_ms = (time.monotonic_ns() - start) // 100_000 / 10
 
     loc = CGEventGetLocation(event)
     x, y = int(loc.x), int(loc.y)
     flags = CGEventGetFlags(event)
-    modifiers = _get_modifiers(flags)
+    mod_mask = flags & _MODIFIER_MASK
+    modifiers = _modifiers_for(mod_mask)
     pid, app_name = _get_front_app()
 
     ev = {
-        "ts_offset_ms": round(ts_offset, 1),
+        "ts_offset_ms": ts_offset_ms,
         "x": x, "y": y,
         "modifiers": modifiers,
         "pid": pid,
@@ -240,32 +325,15 @@ def _on_event(proxy, etype, event, refcon):
             ev["button"] = "middle"
         ev["event_type"] = "click"
 
-        # AX hit-test
-        ax_role, ax_label = _hit_test_ax(x, y, pid=pid)
-        if ax_role:
-            ev["ax_role"] = ax_role
-        if ax_label:
-            ev["ax_label"] = ax_label
-
-        # Window bounds → relative coordinates
-        win = _find_window_at(x, y, pid=pid)
-        if win:
-            ev["window_x"] = win["x"]
-            ev["window_y"] = win["y"]
-            ev["window_w"] = win["w"]
-            ev["window_h"] = win["h"]
-            if win["w"] > 0 and win["h"] > 0:
-                ev["rel_x"] = round((x - win["x"]) / win["w"], 4)
-                ev["rel_y"] = round((y - win["y"]) / win["h"], 4)
-
     elif etype_int == kCGEventKeyDown:
         key_code = CGEventGetIntegerValueField(event, kCGKeyboardEventKeycode)
         # Skip modifier-only key presses
         if key_code in _MODIFIER_KEYCODES:
             return event
         ev["event_type"] = "key"
-        ev["key_code"] = int(key_code)
-        ev["key_char"] = _key_char(int(key_code), modifiers)
+        key_code = int(key_code)
+        ev["key_code"] = key_code
+        ev["key_char"] = _key_char_for(key_code, mod_mask)
 
     elif etype_int == kCGEventScrollWheel:
         delta = CGEventGetIntegerValueField(event, kCGScrollWheelEventDeltaAxis1)
@@ -276,38 +344,139 @@ def _on_event(proxy, etype, event, refcon):
         # Unknown event type — skip
         return event
 
-    with _lock:
-        _event_buffer.append(ev)
+    if _pending.qsize() < _MAX_EVENTS:  # Enricher far behind: drop, don't stall
+        _pending.put(ev)
 
     return event
 
 
+# ---------------------------------------------------------------------------
+# Enrichment (off the tap thread)
+# ---------------------------------------------------------------------------
+
+def _enrich_click(ev):
+    """Add AX element and window-relative coordinates to a click event."""
+    x, y, pid = ev["x"], ev["y"], ev.get("pid")
+
+    # AX hit-test
+    ax_role, ax_label = _hit_test_ax(x, y, pid=pid)
+    if ax_role:
+        ev["ax_role"] = ax_role
+    if ax_label:
+        ev["ax_label"] = ax_label
+
+    # Window bounds → relative coordinates
+    win = _find_window_at(x, y, pid=pid)
+    if win:
+        ev["window_x"] = win["x"]
+        ev["window_y"] = win["y"]
+        ev["window_w"] = win["w"]
+        ev["window_h"] = win["h"]
+        if win["w"] > 0 and win["h"] > 0:
+            ev["rel_x"] = round((x - win["x"]) / win["w"], 4)
+            ev["rel_y"] = round((y - win["y"]) / win["h"], 4)
+
+
+def _enrich_loop():
+    """Enricher thread: enrich queued events and move them to the buffer.
+
+    Exits on a None sentinel (see _stop_enricher).
+    """
+    while True:
+        ev = _pending.get()
+        if ev is None:
+            return
+        if ev["event_type"] == "click" and not _enrich_skip.is_set():
+            try:
+                _enrich_click(ev)
+            except Exception:
+                pass
+        _event_buffer.append(ev)
+
+
+def _take_events():
+    """Pop everything currently in the buffer, oldest first."""
+    events = []
+    popleft = _event_buffer.popleft
+    try:
+        for _ in range(len(_event_buffer)):
+            events.append(popleft())
+    except IndexError:
+        pass  # A concurrent drain took the rest
+    return events
+
+
+def _start_enricher():
+    """Start the enricher thread for a new recording."""
+    global _enricher
+    _enrich_skip.clear()
+    _enricher = threading.Thread(target=_enrich_loop, daemon=True, name="nexus-via-enrich")
+    _enricher.start()
+
+
+def _stop_enricher():
+    """Let the enricher finish queued events, then stop it.
+
+    Always joins: a thread left running would keep feeding _event_buffer
+    and could swallow the next recording's sentinel. If enrichment takes
+    longer than _ENRICH_GRACE, the rest is flushed unenriched, so the wait
+    is bounded by the one AX call in flight.
+    """
+    global _enricher
+    if _enricher is None:
+        return
+    _pending.put(None)
+    _enricher.join(timeout=_ENRICH_GRACE)
+    if _enricher.is_alive():
+        _enrich_skip.set()
+        _enricher.join()
+    _enricher = None
+
+
 # ---------------------------------------------------------------------------
 # Background thread
 # ---------------------------------------------------------------------------
 
+_QOS_CLASS_USER_INTERACTIVE = 0x21  # <sys/qos.h>
+
+# Event mask: left click, right click, middle click, key down, scroll
+_TAP_MASK = (
+    (1 << kCGEventLeftMouseDown) |
+    (1 << kCGEventRightMouseDown) |
+    (1 << kCGEventOtherMouseDown) |
+    (1 << kCGEventKeyDown) |
+    (1 << kCGEventScrollWheel)
+)
+
+
+def _raise_thread_qos():
+    """Run the calling thread at user-interactive QoS (best effort).
+
+    A session event tap on a default-QoS thread adds input latency for
+    every app while the scheduler gets round to it.
+    """
+    try:
+        libsystem = ctypes.CDLL("/usr/lib/libSystem.B.dylib")
+        libsystem.pthread_set_qos_class_self_np(_QOS_CLASS_USER_INTERACTIVE, 0)
+    except (OSError, AttributeError):
+        pass
+
+
 def _tap_loop():
     """Background thread: runs CGEventTap on a CFRunLoop.
 
     Creates a listen-only event tap for mouse clicks, key presses, and scrolls.
     Uses CFRunLoopRunInMode in a loop (same pattern as observe.py).
     """
-    global _runloop
-
-    # Event mask: left click, right click, middle click, key down, scroll
-    mask = (
-        (1 << kCGEventLeftMouseDown) |
-        (1 << kCGEventRightMouseDown) |
-        (1 << kCGEventOtherMouseDown) |
-        (1 << kCGEventKeyDown) |
-        (1 << kCGEventScrollWheel)
-    )
+    global _runloop, _tap_port
+
+    _raise_thread_qos()
 
     tap = CGEventTapCreate(
         kCGSessionEventTap,
         kCGHeadInsertEventTap,
         kCGEventTapOptionListenOnly,
-        mask,
+        _TAP_MASK,
         _on_event,
         None,
     )
@@ -317,8 +486,9 @@ def _tap_loop():
         return
 
     source = CFMachPortCreateRunLoopSource(None, tap, 0)
-    _runloop = CFRunLoopGetCurrent()
-    CFRunLoopAddSource(_runloop, source, kCFRunLoopDefaultMode)
+    runloop = _runloop = CFRunLoopGetCurrent()
+    CFRunLoopAddSource(runloop, source, kCFRunLoopDefaultMode)
+    _tap_port = tap
     CGEventTapEnable(tap, True)
 
     _runloop_ready.set()
@@ -326,8 +496,12 @@ def _tap_loop():
     while not _stop_flag.is_set():
         CFRunLoopRunInMode(kCFRunLoopDefaultMode, 1.0, False)
 
-    # Cleanup
+    # Cleanup: detach the source and invalidate the port, otherwise every
+    # start/stop cycle leaves a live tap source behind in WindowServer.
+    _tap_port = None
     CGEventTapEnable(tap, False)
+    CFRunLoopRemoveSource(runloop, source, kCFRunLoopDefaultMode)
+    CFMachPortInvalidate(tap)
     _runloop = None
 
 
@@ -341,20 +515,27 @@ def start_tap():
     Returns True if tap started successfully, False if it was already running
     or failed to create.
     """
-    global _thread, _runloop_ready, _recording_start
+    global _thread, _runloop_ready, _recording_start, _tap_reenables
 
     with _lock:
         if _thread is not None and _thread.is_alive():
             return False
         _stop_flag.clear()
         _event_buffer.clear()
-        _recording_start = time.time()
+        while not _pending.empty():
+            _pending.get_nowait()
+        _win_cache["ts"] = 0.0
+        _tap_reenables = 0
+        _recording_start = time.monotonic_ns()
         _runloop_ready = threading.Event()
         _thread = threading.Thread(target=_tap_loop, daemon=True, name="nexus-via-tap")
         _thread.start()
 
     _runloop_ready.wait(timeout=3.0)
-    return _runloop is not None
+    if _runloop is None:
+        return False
+    _start_enricher()
+    return True
 
 
 def stop_tap():
@@ -373,22 +554,22 @@ def stop_tap():
             except Exception:
                 pass
         _thread.join(timeout=3.0)
-        _thread = None
+        if not _thread.is_alive():
+            _thread = None  # Still alive: start_tap keeps refusing until it exits
 
     _recording_start = None
-
-    with _lock:
-        events = list(_event_buffer)
-        _event_buffer.clear()
-    return events
+    _stop_enricher()  # Tap is stopped, so everything it queued gets enriched
+    return _take_events()
 
 
 def drain_events():
-    """Atomically drain all buffered events without stopping the tap."""
-    with _lock:
-        events = list(_event_buffer)
-        _event_buffer.clear()
-    return events
+    """Drain all buffered events without stopping the tap."""
+    return _take_events()
+
+
+def reenable_count():
+    """Times macOS disabled the tap during this recording (and we re-enabled it)."""
+    return _tap_reenables
 
 
 def is_tapping():
@@ -70,6 +70,20 @@ class TestDrainEvents:
         observe.drain_events()
         assert observe.drain_events() == []
 
+    def test_drain_survives_concurrent_drain(self):
+        from nexus.sense import observe
+        for i in range(3):
+            observe._event_buffer.append({"type": "AXValueChanged", "pid": 1, "ts": 0.0, "role": "", "label": str(i)})
+
+        real_popleft = observe._event_buffer.popleft
+        fake = MagicMock()
+        fake.__len__ = lambda s: 3
+        # Another reader empties the buffer after our first pop
+        fake.popleft = MagicMock(side_effect=[real_popleft(), IndexError()])
+        with patch.object(observe, "_event_buffer", fake):
+            events = observe.drain_events()
+        assert [e["label"] for e in events] == ["0"]
+
     def test_buffer_overflow_drops_oldest(self):
         from nexus.sense import observe
         with observe._lock:
@@ -147,6 +161,34 @@ class TestDebounce:
                 observe._on_notification(mock_observer, mock_element, "AXWindowCreated", None)
                 mock_invalidate.assert_called_once()
 
+    def test_attributes_read_in_one_call(self):
+        from nexus.sense import observe
+        mock_observer = MagicMock()
+        observe._observer_to_pid[id(mock_observer)] = 42
+        mock_element = MagicMock()
+        mock_element.get_multiple_attribute_values.return_value = {
+            "AXRole": "AXButton", "AXTitle": None, "AXDescription": "Close",
+        }
+        with patch.object(observe, "ax_attr") as mock_ax_attr:
+            with patch.object(observe, "invalidate_cache"):
+                observe._on_notification(mock_observer, mock_element, "AXWindowCreated", None)
+        mock_ax_attr.assert_not_called()
+        mock_element.get_multiple_attribute_values.assert_called_once_with(
+            "AXRole", "AXTitle", "AXDescription")
+        (ev,) = observe.drain_events()
+        assert ev["role"] == "AXButton"
+        assert ev["label"] == "Close"
+
+    def test_callback_marks_pid_dirty(self):
+        from nexus.sense import observe
+        mock_observer = MagicMock()
+        observe._observer_to_pid[id(mock_observer)] = 42
+        with patch.object(observe, "ax_attr", return_value=""), \
+             patch.object(observe, "invalidate_cache"), \
+             patch.object(observe, "mark_dirty") as mock_dirty:
+            observe._on_notification(mock_observer, MagicMock(), "AXWindowCreated", None)
+        mock_dirty.assert_called_once_with(42)
+
     def test_unknown_observer_ignored(self):
         """Callback with unregistered observer ID is silently ignored."""
         from nexus.sense import observe
@@ -239,6 +281,22 @@ class TestObserverLifecycle:
         assert not observe.is_observing(42)
         assert observe.is_observing(99)
 
+    @patch("nexus.sense.observe.CFRunLoopWakeUp")
+    @patch("nexus.sense.observe.CFRunLoopRemoveSource")
+    @patch("nexus.sense.observe.AXObserverGetRunLoopSource", return_value=MagicMock())
+    @patch("nexus.sense.observe.pyax.create_observer")
+    def test_stop_drops_debounce_entries(self, mock_create, mock_source, mock_cf_rm, mock_wake):
+        mock_create.return_value = _mock_observer()
+        from nexus.sense import observe
+        observe._runloop = MagicMock()
+        observe._thread = MagicMock(is_alive=lambda: True)
+
+        observe.start_observing(42, "Safari")
+        observe._last_event[(42, "AXValueChanged")] = time.monotonic()
+        observe._last_event[(99, "AXValueChanged")] = time.monotonic()
+        observe.stop_observing(42)
+        assert list(observe._last_event) == [(99, "AXValueChanged")]
+
     @patch("nexus.sense.observe.CFRunLoopWakeUp")
     @patch("nexus.sense.observe.CFRunLoopRemoveSource")
     @patch("nexus.sense.observe.AXObserverGetRunLoopSource", return_value=MagicMock())
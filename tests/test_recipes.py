@@ -77,6 +77,55 @@ class TestRecipeDecorator:
         assert names.index("test_recipes.first") < names.index("test_recipes.second")
         assert names.index("test_recipes.second") < names.index("test_recipes.third")
 
+    def test_reregister_keeps_order(self):
+        from nexus.via.recipe import recipe, _registry
+
+        def register(name, priority):
+            def fn(m, pid=None):
+                return {"ok": True}
+            fn.__name__ = name
+            recipe(name, priority=priority)(fn)
+
+        register("a", 50)
+        register("b", 50)
+        register("c", 50)
+        register("a", 50)  # reload, same priority: stays first among equals
+        assert [r.name for r in _registry] == ["test_recipes.a", "test_recipes.b", "test_recipes.c"]
+        register("b", 10)  # priority changed: moves
+        assert [r.name for r in _registry] == ["test_recipes.b", "test_recipes.a", "test_recipes.c"]
+
+    def test_forget_module(self):
+        from nexus.via.recipe import _registry, _forget_module, Recipe
+
+        for name in ("system.gone", "system.kept", "mail.check"):
+            _registry.append(Recipe(name, re.compile(name), lambda m, pid=None: None, None, 50))
+        _forget_module("system")
+        assert [r.name for r in _registry] == ["mail.check"]
+
+    def test_failed_reload_keeps_old_recipes(self):
+        import nexus.via.recipes as pkg
+        from nexus.via import recipe as mod
+        system = importlib.import_module("nexus.via.recipes.system")
+        mod._registry.clear()
+        importlib.reload(system)
+        before = [r.name for r in mod._registry]
+        real_reload = importlib.reload
+
+        def broken_reload(m):
+            if m is not system:
+                return real_reload(m)
+            # Recipe file mid-edit: registers one new recipe, then fails
+            def half(m, pid=None):
+                return {"ok": True}
+            half.__module__ = system.__name__
+            mod.recipe(r"half registered")(half)
+            raise SyntaxError("invalid syntax")
+
+        with patch("importlib.reload", side_effect=broken_reload):
+            pkg._load_all()
+        names = [r.name for r in mod._registry if r.name.startswith("system.")]
+        assert names == before
+
     def test_pattern_compiled(self):
         from nexus.via.recipe import recipe, _registry
 
@@ -86,6 +135,7 @@ class TestRecipeDecorator:
 
         assert isinstance(_registry[0].pattern, re.Pattern)
         assert _registry[0].pattern.flags & re.IGNORECASE
+        assert _registry[0].pattern.flags & re.ASCII
 
 
 # ===========================================================================
@@ -191,6 +241,57 @@ class TestRecipeMatching:
         rcp, _ = match_recipe("test action")
         assert rcp.name.endswith("high_priority")
 
+    def test_priority_beats_match_position(self):
+        """A higher-priority recipe wins even if another matches earlier in the text."""
+        from nexus.via.recipe import recipe, match_recipe
+
+        @recipe(r"alpha", priority=90)
+        def early(m, pid=None):
+            return {"ok": True}
+
+        @recipe(r"(omega)", priority=10)
+        def late(m, pid=None):
+            return {"ok": True}
+
+        rcp, m = match_recipe("alpha then omega")
+        assert rcp.name.endswith("late")
+        assert m.group(1) == "omega"
+
+    def test_dispatch_cache_reset_on_registration(self):
+        from nexus.via import recipe as mod
+
+        @mod.recipe(r"check mail", app="Mail")
+        def check(m, pid=None):
+            return {"ok": True}
+
+        assert mod.match_recipe("archive this", app_name="Mail") == (None, None)
+        assert mod._dispatch_cache["mail"] == ["mail", None]
+
+        @mod.recipe(r"archive this", app="Mail")
+        def archive(m, pid=None):
+            return {"ok": True}
+
+        rcp, _ = mod.match_recipe("archive this", app_name="Mail")
+        assert rcp is not None and rcp.name.endswith(".archive")
+
+    def test_union_fallback_with_named_groups(self):
+        """Patterns that can't share one alternation still match one by one."""
+        from nexus.via import recipe as mod
+        from nexus.via.recipe import recipe, match_recipe
+
+        @recipe(r"open (?P<what>\w+)")
+        def open_a(m, pid=None):
+            return {"ok": True}
+
+        @recipe(r"close (?P<what>\w+)")
+        def close_b(m, pid=None):
+            return {"ok": True}
+
+        rcp, m = match_recipe("close door")
+        assert rcp.name.endswith("close_b")
+        assert m.group("what") == "door"
+        assert mod._unions[None] is None
+
 
 # ===========================================================================
 # TestRecipeExecution
@@ -257,6 +358,57 @@ class TestRecipeExecution:
         assert received_pid == 12345
 
 
+class TestCurrentAppCache:
+    """Tests for the short-lived _current_app() cache."""
+
+    def setup_method(self):
+        from nexus.via import recipe as mod
+        mod._registry.clear()
+        mod._loaded = True
+        mod._invalidate_current_app()
+
+    def test_cached_per_pid(self):
+        from nexus.via import recipe as mod
+        with patch.object(mod, "_frontmost", return_value=None), \
+                patch.object(mod, "_lookup_app", return_value="Mail") as mock_lookup:
+            assert mod._current_app(42) == "Mail"
+            assert mod._current_app(42) == "Mail"
+            assert mock_lookup.call_count == 1
+            mod._current_app(7)
+            assert mock_lookup.call_count == 2
+
+    def test_frontmost_keyed_on_live_pid(self):
+        from nexus.via import recipe as mod
+        front = MagicMock()
+        front.processIdentifier.return_value = 10
+        front.localizedName.return_value = "Finder"
+        with patch.object(mod, "_frontmost", return_value=front):
+            assert mod._current_app(None) == "Finder"
+            assert mod._current_app(None) == "Finder"
+            assert front.localizedName.call_count == 1
+
+            # App switch within the TTL: new pid, so no stale name
+            front.processIdentifier.return_value = 20
+            front.localizedName.return_value = "Safari"
+            assert mod._current_app(None) == "Safari"
+
+    def test_execute_recipe_invalidates(self):
+        from nexus.via import recipe as mod
+
+        @mod.recipe(r"hide it")
+        def hide(m, pid=None):
+            return {"ok": True}
+
+        front = MagicMock()
+        front.processIdentifier.return_value = 10
+        with patch.object(mod, "_frontmost", return_value=front), \
+                patch.object(mod, "_lookup_app", return_value="Mail") as mock_lookup:
+            rcp, match = mod.match_recipe("hide it")
+            mod.execute_recipe(rcp, match)
+            mod._current_app(None)
+            assert mock_lookup.call_count == 2
+
+
 # ===========================================================================
 # TestRecipeHelpers
 # ===========================================================================
@@ -314,8 +466,15 @@ class TestRecipeHelpers:
         assert result["ok"] is True
         mock_run.assert_called_once()
         cmd = mock_run.call_args[0][0]
-        assert "open" in cmd
-        assert "x-apple.systempreferences" in cmd
+        assert cmd == ["open", "x-apple.systempreferences:com.apple.wifi"]
+        assert mock_run.call_args[1]["shell"] is False
+
+    @patch("subprocess.run")
+    def test_cli_string_uses_shell(self, mock_run):
+        from nexus.via.recipe import cli
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        cli("echo hi | wc -c")
+        assert mock_run.call_args[1]["shell"] is True
 
 
 # ===========================================================================
@@ -397,10 +556,11 @@ class TestListRecipes:
         from nexus.via import recipe as mod
         mod._registry.clear()
         mod._loaded = True
+        mod._list_cache = None
 
     def test_list_empty(self):
         from nexus.via.recipe import list_recipes
-        assert list_recipes() == []
+        assert list_recipes() == ()
 
     def test_list_returns_metadata(self):
         from nexus.via.recipe import recipe, list_recipes
@@ -415,6 +575,24 @@ class TestListRecipes:
         assert recipes[0]["app"] == "mail"
         assert recipes[0]["priority"] == 10
 
+    def test_list_cached_until_registration(self):
+        from nexus.via.recipe import recipe, list_recipes
+
+        @recipe(r"first")
+        def first(m, pid=None):
+            return {"ok": True}
+
+        recipes = list_recipes()
+        assert list_recipes() is recipes
+        with pytest.raises(TypeError):
+            recipes[0]["app"] = "mail"
+
+        @recipe(r"second")
+        def second(m, pid=None):
+            return {"ok": True}
+
+        assert len(list_recipes()) == 2
+
 
 # ===========================================================================
 # TestRecipePatterns — verify actual recipe patterns
@@ -487,6 +665,74 @@ class TestSystemRecipePatterns:
         rcp, _ = match_recipe("type hello in search")
         assert rcp is None
 
+    def test_readings_cached_until_set(self):
+        from nexus.via import recipe as mod
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mod._ttl_results.clear()
+        with patch("nexus.via.recipes.system.applescript",
+                   return_value={"ok": True, "result": "40"}) as mock_as:
+            for _ in range(2):
+                rcp, m = match_recipe("get volume")
+                result = execute_recipe(rcp, m)
+            assert result["result"] == "40"
+            assert mock_as.call_count == 1
+
+            rcp, m = match_recipe("set volume to 60")
+            execute_recipe(rcp, m)
+            rcp, m = match_recipe("get volume")
+            execute_recipe(rcp, m)
+            assert mock_as.call_count == 3
+
+    @patch("subprocess.run")
+    def test_screenshot_paths_unique_on_repeat(self, mock_run):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        paths = set()
+        for _ in range(3):
+            rcp, m = match_recipe("take screenshot")
+            execute_recipe(rcp, m)
+            argv = mock_run.call_args[0][0]
+            assert argv[:2] == ["screencapture", "-x"]
+            paths.add(argv[-1])
+        assert len(paths) == 3
+
+    @patch("subprocess.run")
+    def test_battery_parsed_without_pipe(self, mock_run):
+        from nexus.via import recipe as mod
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mod._ttl_results.clear()
+        mock_run.return_value = MagicMock(returncode=0, stderr="", stdout=(
+            "Now drawing from 'AC Power'\n"
+            " -InternalBattery-0 (id=1)\t87%; charging; 0:42 remaining\n"))
+        rcp, m = match_recipe("battery level")
+        assert execute_recipe(rcp, m)["result"] == "87%"
+        assert mock_run.call_args[0][0] == ["pmset", "-g", "batt"]
+        assert mock_run.call_args[1]["shell"] is False
+
+    @patch("subprocess.run")
+    def test_battery_missing_fails_uncached(self, mock_run):
+        from nexus.via import recipe as mod
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mod._ttl_results.clear()
+        mock_run.return_value = MagicMock(
+            returncode=0, stderr="", stdout="Now drawing from 'AC Power'\n")
+        rcp, m = match_recipe("battery level")
+        assert execute_recipe(rcp, m) == {"ok": False, "error": "no battery"}
+        execute_recipe(rcp, m)
+        assert mock_run.call_count == 2  # Failure not cached
+
+    @patch("subprocess.run")
+    def test_wifi_ssid_parsed_without_pipe(self, mock_run):
+        from nexus.via import recipe as mod
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mod._ttl_results.clear()
+        mock_run.return_value = MagicMock(returncode=0, stderr="", stdout=(
+            "     agrCtlRSSI: -52\n"
+            "          BSSID: aa:bb:cc:dd:ee:ff\n"
+            "           SSID: Cafe Guest\n"))
+        rcp, m = match_recipe("wifi name")
+        assert execute_recipe(rcp, m)["result"] == "Cafe Guest"
+
 
 class TestSettingsRecipePatterns:
     """Test that settings.py recipe patterns match expected intents."""
@@ -514,6 +760,23 @@ class TestSettingsRecipePatterns:
         rcp, _ = match_recipe("open system settings keyboard")
         assert rcp is not None
 
+    def test_partial_pane_names(self):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        with patch("nexus.via.recipes.settings.url_scheme", return_value={"ok": True}) as mock_open:
+            for intent, suffix in (("settings scanners", "Print-Scan-Settings.extension"),
+                                   ("settings printer", "Print-Scan-Settings.extension"),
+                                   ("settings sound output", "Sound-Settings.extension")):
+                rcp, m = match_recipe(intent)
+                execute_recipe(rcp, m)
+                assert mock_open.call_args[0][0].endswith(suffix)
+
+    def test_unknown_pane_lists_known(self):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        rcp, m = match_recipe("settings xyzzy")
+        result = execute_recipe(rcp, m)
+        assert result["ok"] is False
+        assert "bluetooth" in result["error"]
+
 
 class TestMailRecipePatterns:
     """Test that mail.py recipe patterns match expected intents."""
@@ -571,6 +834,17 @@ class TestFinderRecipePatterns:
         assert rcp is not None
         assert "test-dir" in m.group(1)
 
+    @patch("subprocess.run")
+    def test_cli_recipes_use_argv(self, mock_run):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        rcp, m = match_recipe('reveal "/tmp/a b.txt" in finder')
+        execute_recipe(rcp, m)
+        assert mock_run.call_args[0][0] == ["open", "-R", "/tmp/a b.txt"]
+        rcp, m = match_recipe("create folder my dir in /tmp")
+        execute_recipe(rcp, m)
+        assert mock_run.call_args[0][0] == ["mkdir", "-p", "/tmp/my dir"]
+
 
 class TestAppsRecipePatterns:
     """Test that apps.py recipe patterns match expected intents."""
@@ -612,6 +886,99 @@ class TestFilesRecipePatterns:
         rcp, _ = match_recipe("file size of /tmp/test.txt")
         assert rcp is not None
 
+    @patch("subprocess.run")
+    def test_find_files_argv_and_truncation(self, mock_run):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="\n".join(f"/f{i}" for i in range(30)), stderr="")
+        rcp, m = match_recipe('find files named "my report"')
+        result = execute_recipe(rcp, m)
+        assert mock_run.call_args[0][0] == ["mdfind", "kMDItemDisplayName == *my report*"]
+        assert result["result"].splitlines() == [f"/f{i}" for i in range(20)]
+
+    @patch("subprocess.run")
+    def test_disk_usage_last_line(self, mock_run):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="Filesystem Size\n/dev/disk1 500Gi\n", stderr="")
+        rcp, m = match_recipe("disk usage")
+        assert execute_recipe(rcp, m)["result"] == "/dev/disk1 500Gi"
+        assert mock_run.call_args[0][0] == ["df", "-h", "/"]
+
+    @patch("subprocess.run")
+    def test_file_size_first_field(self, mock_run):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mock_run.return_value = MagicMock(returncode=0, stdout="4.0K\t/tmp/a b\n", stderr="")
+        rcp, m = match_recipe("file size of /tmp/a b")
+        assert execute_recipe(rcp, m)["result"] == "4.0K"
+        assert mock_run.call_args[0][0] == ["du", "-sh", "/tmp/a b"]
+
+    @patch("subprocess.run")
+    def test_file_size_partial_read_keeps_total(self, mock_run):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        # Unreadable subdirectory: total on stdout, exit code 1
+        mock_run.return_value = MagicMock(
+            returncode=1, stdout="12K\t/tmp/dutest\n",
+            stderr="du: /tmp/dutest/locked: Permission denied\n")
+        rcp, m = match_recipe("size of /tmp/dutest")
+        assert execute_recipe(rcp, m) == {"ok": True, "result": "12K"}
+
+    @patch("subprocess.run")
+    def test_file_size_missing_path_fails(self, mock_run):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mock_run.return_value = MagicMock(
+            returncode=1, stdout="", stderr="du: /nope: No such file or directory\n")
+        rcp, m = match_recipe("size of /nope")
+        result = execute_recipe(rcp, m)
+        assert result["ok"] is False
+        assert "No such file" in result["error"]
+
+
+class TestClean:
+    """clean() strips whitespace and quotes around captured text."""
+
+    def test_strips_quotes_and_space(self):
+        from nexus.via.recipe import clean
+        assert clean('  "~/My Docs" ') == "~/My Docs"
+        assert clean("'Safari'") == "Safari"
+
+    def test_keeps_inner_quotes(self):
+        from nexus.via.recipe import clean
+        assert clean('say "hi" now') == 'say "hi" now'
+
+
+class TestOsaQuote:
+    """User text is escaped before it is spliced into AppleScript."""
+
+    def test_plain(self):
+        from nexus.via.recipe import osa_quote
+        assert osa_quote("hello") == '"hello"'
+
+    def test_quotes_and_backslashes(self):
+        from nexus.via.recipe import osa_quote
+        assert osa_quote('say "hi" \\ bye') == '"say \\"hi\\" \\\\ bye"'
+
+    def setup_method(self):
+        _reload_recipe_module("notes")
+
+    @patch("nexus.via.recipes.notes.applescript")
+    def test_note_body_escaped(self, mock_as):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mock_as.return_value = {"ok": True, "result": ""}
+        rcp, m = match_recipe('create note groceries saying buy "oat" milk', app_name="Notes")
+        execute_recipe(rcp, m)
+        script = mock_as.call_args[0][0]
+        assert 'body:"buy \\"oat\\" milk"' in script
+
+    @patch("nexus.via.recipes.notes.applescript")
+    def test_search_not_found_message_concatenates(self, mock_as):
+        from nexus.via.recipe import match_recipe, execute_recipe
+        mock_as.return_value = {"ok": True, "result": ""}
+        rcp, m = match_recipe('search notes for a"b', app_name="Notes")
+        execute_recipe(rcp, m)
+        script = mock_as.call_args[0][0]
+        assert '"No notes found for: " & "a\\"b"' in script
+
 
 # ===========================================================================
 # TestAutoDiscovery
@@ -645,13 +1012,14 @@ class TestAutoDiscovery:
         importlib.reload(pkg)
         mod._loaded = True
         count1 = len(mod._registry)
-        # Calling _ensure_loaded again should not add duplicates
+        # Reloading every recipe module again must not add duplicates
         mod._loaded = False
         importlib.reload(pkg)
-        # But since modules are cached, reload will re-add. That's the nature
-        # of the decorator pattern. In real use, _loaded prevents double-loading.
-        # For this test, just verify it loaded at least once.
+        mod._loaded = True
+        names = [r.name for r in mod._registry]
         assert count1 > 0
+        assert len(names) == count1
+        assert len(set(names)) == len(names)
 
 
 # ===========================================================================
@@ -300,6 +300,94 @@ class TestTreeCache:
         assert result is None
 
 
+class _FakeAXElement:
+    """Minimal AXUIElement stand-in: bulk attribute reads + child iteration."""
+
+    def __init__(self, attrs, children=()):
+        self.attrs = attrs
+        self.children = list(children)
+        self.bulk_calls = 0
+
+    def get_multiple_attribute_values(self, *names):
+        self.bulk_calls += 1
+        return {n: self.attrs.get(n) for n in names}
+
+    def __getitem__(self, attr):
+        raise AssertionError("walk_tree should not read attributes one by one")
+
+    def __iter__(self):
+        return iter(self.children)
+
+
+class TestWalkTreeBatched:
+    """walk_tree reads each node's attributes in a single AX call."""
+
+    def test_one_bulk_read_per_node(self):
+        from nexus.sense.access import walk_tree
+        button = _FakeAXElement({"AXRole": "AXButton", "AXTitle": "Save"})
+        window = _FakeAXElement({"AXRole": "AXWindow", "AXTitle": "Doc"}, [button])
+        result = walk_tree(window)
+        assert [el["label"] for el in result] == ["Doc", "Save"]
+        assert window.bulk_calls == 1
+        assert button.bulk_calls == 1
+
+
+class TestFindFirst:
+    """find_first stops at the first positioned match, in walk order."""
+
+    def _tree(self):
+        pos = {"x": 10, "y": 20}
+        unplaced = _FakeAXElement({"AXRole": "AXButton", "AXTitle": "Save"})
+        first = _FakeAXElement({"AXRole": "AXButton", "AXTitle": "Save", "AXPosition": pos})
+        later = _FakeAXElement({"AXRole": "AXButton", "AXTitle": "Save",
+                                "AXPosition": {"x": 400, "y": 300}})
+        group = _FakeAXElement({"AXRole": "AXGroup"}, [unplaced, first])
+        window = _FakeAXElement({"AXRole": "AXWindow"}, [group, later])
+        return window, later
+
+    def test_returns_first_positioned_match(self):
+        from unittest.mock import patch
+        from nexus.sense import access
+        window, later = self._tree()
+        with patch.object(access, "_get_window", return_value=(window, False)):
+            el = access.find_first(lambda role, label: role == "AXButton" and label == "Save")
+        assert el["pos"] == (10, 20)
+        assert later.bulk_calls == 0  # never reached
+
+    def test_no_match(self):
+        from unittest.mock import patch
+        from nexus.sense import access
+        window, _ = self._tree()
+        with patch.object(access, "_get_window", return_value=(window, False)):
+            assert access.find_first(lambda role, label: label == "Open") is None
+
+    def test_finds_match_past_a_thousand_nodes(self):
+        from unittest.mock import patch
+        from nexus.sense import access
+        # Unlabeled layout groups don't count towards the element cap
+        filler = [_FakeAXElement({"AXRole": "AXGroup"}) for _ in range(1500)]
+        target = _FakeAXElement({"AXRole": "AXButton", "AXTitle": "Send",
+                                 "AXPosition": {"x": 5, "y": 5}})
+        window = _FakeAXElement({"AXRole": "AXWindow"}, filler + [target])
+        with patch.object(access, "_get_window", return_value=(window, False)):
+            el = access.find_first(lambda role, label: label == "Send", max_elements=200)
+        assert el["pos"] == (5, 5)
+
+    def test_gives_up_after_max_elements(self):
+        from unittest.mock import patch
+        from nexus.sense import access
+        buttons = [_FakeAXElement({"AXRole": "AXButton", "AXTitle": f"b{i}",
+                                   "AXPosition": {"x": i, "y": 0}}) for i in range(5)]
+        window = _FakeAXElement({"AXRole": "AXWindow"}, buttons)
+
+        def match(role, label):
+            return label == "b4"
+
+        with patch.object(access, "_get_window", return_value=(window, False)):
+            assert access.find_first(match, max_elements=3) is None
+            assert access.find_first(match, max_elements=5)["pos"] == (4, 0)
+
+
 # ===========================================================================
 # Full describe — single-pass tree walk
 # ===========================================================================
@@ -40,6 +40,9 @@ def _reset_recording():
     rec._recording = None
     import nexus.via.tap as tap
     tap._event_buffer.clear()
+    tap._stop_enricher()
+    tap._win_cache["ts"] = 0.0
+    tap._tap_reenables = 0
     tap._recording_start = None
     tap._thread = None
     tap._runloop = None
@@ -102,6 +105,10 @@ class TestModifiers:
         assert result["ctrl"] is False
         assert result["opt"] is False
 
+    def test_shared_per_combination(self):
+        from nexus.via.tap import _get_modifiers
+        assert _get_modifiers(0) is _get_modifiers(0)
+
 
 class TestKeyChar:
 
@@ -122,9 +129,19 @@ class TestKeyChar:
         result = _key_char(999, {"cmd": False, "shift": False, "ctrl": False, "opt": False})
         assert result == "key999"
 
+    def test_memoized_matches_key_char(self):
+        from nexus.via.tap import _key_char, _key_char_for, _modifiers_for
+        for code, mask in ((1, 0), (999, 0), (36, 0)):
+            assert _key_char_for(code, mask) == _key_char(code, _modifiers_for(mask))
+        assert _key_char_for(1, 0) is _key_char_for(1, 0)
+
 
 class TestFindWindowAt:
 
+    def setup_method(self):
+        import nexus.via.tap as tap
+        tap._win_cache["ts"] = 0.0
+
     @patch("nexus.via.tap.CGWindowListCopyWindowInfo")
     def test_finds_matching_window(self, mock_wl):
         from nexus.via.tap import _find_window_at
@@ -168,6 +185,80 @@ class TestFindWindowAt:
         result = _find_window_at(400, 300)
         assert result is None
 
+    @patch("nexus.via.tap.CGWindowListCopyWindowInfo")
+    def test_window_list_shared_within_ttl(self, mock_wl):
+        import nexus.via.tap as tap
+        from nexus.via.tap import _find_window_at
+        mock_wl.return_value = [
+            {
+                "kCGWindowOwnerPID": 100,
+                "kCGWindowBounds": {"X": 100, "Y": 50, "Width": 800, "Height": 600},
+            }
+        ]
+        assert _find_window_at(400, 300, pid=100) is not None
+        assert _find_window_at(500, 400, pid=100) is not None
+        assert mock_wl.call_count == 1
+
+        tap._win_cache["ts"] -= tap._WIN_CACHE_TTL  # expire
+        _find_window_at(400, 300, pid=100)
+        assert mock_wl.call_count == 2
+
+    @patch("nexus.via.tap.CGWindowListCopyWindowInfo")
+    def test_pid_scoped_to_own_windows(self, mock_wl):
+        from nexus.via.tap import _find_window_at
+        mock_wl.return_value = [
+            {
+                "kCGWindowOwnerPID": 200,
+                "kCGWindowBounds": {"X": 0, "Y": 0, "Width": 1000, "Height": 1000},
+            },
+            {
+                "kCGWindowOwnerPID": 100,
+                "kCGWindowBounds": {"X": 100, "Y": 50, "Width": 800, "Height": 600},
+            },
+        ]
+        assert _find_window_at(400, 300, pid=100) == {"x": 100, "y": 50, "w": 800, "h": 600}
+        assert _find_window_at(400, 300) == {"x": 0, "y": 0, "w": 1000, "h": 1000}
+        assert _find_window_at(950, 950, pid=100) is None
+
+    @patch("nexus.via.tap.CGWindowListCopyWindowInfo", side_effect=RuntimeError("boom"))
+    def test_failure_not_cached(self, mock_wl):
+        from nexus.via.tap import _find_window_at
+        assert _find_window_at(400, 300) is None
+        assert _find_window_at(400, 300) is None
+        assert mock_wl.call_count == 2
+
+
+class TestFrontApp:
+
+    def setup_method(self):
+        import nexus.via.tap as tap
+        tap._front_app_cache.update(pid=None, name=None, ts=0.0)
+        tap._workspace = None
+
+    teardown_method = setup_method
+
+    @patch("nexus.via.tap.NSWorkspace")
+    def test_name_only_reread_when_pid_changes(self, mock_ws):
+        import nexus.via.tap as tap
+        front = mock_ws.sharedWorkspace.return_value.frontmostApplication.return_value
+        front.processIdentifier.return_value = 42
+        front.localizedName.return_value = "Safari"
+
+        assert tap._get_front_app() == (42, "Safari")
+        assert tap._get_front_app() == (42, "Safari")  # Within TTL: no lookup
+        assert front.processIdentifier.call_count == 1
+
+        tap._front_app_cache["ts"] -= tap._FRONT_APP_TTL  # expire
+        assert tap._get_front_app() == (42, "Safari")
+        assert front.processIdentifier.call_count == 2
+        assert front.localizedName.call_count == 1  # Same pid: name kept
+
+        tap._front_app_cache["ts"] -= tap._FRONT_APP_TTL
+        front.processIdentifier.return_value = 77
+        front.localizedName.return_value = "Mail"
+        assert tap._get_front_app() == (77, "Mail")
+        assert mock_ws.sharedWorkspace.call_count == 1  # Instance reused
+
 
 class TestHitTestAX:
 
@@ -207,6 +298,139 @@ class TestTapLifecycle:
         result = start_tap()
         assert result is False
         assert not is_tapping()
+        import nexus.via.tap as tap
+        assert tap._enricher is None
+
+    def test_tap_thread_requests_interactive_qos(self):
+        import nexus.via.tap as tap
+        with patch("nexus.via.tap.ctypes.CDLL") as mock_cdll:
+            tap._raise_thread_qos()
+        mock_cdll.assert_called_once_with("/usr/lib/libSystem.B.dylib")
+        mock_cdll.return_value.pthread_set_qos_class_self_np.assert_called_once_with(0x21, 0)
+
+    @patch("nexus.via.tap.CFMachPortInvalidate")
+    @patch("nexus.via.tap.CFRunLoopRemoveSource")
+    @patch("nexus.via.tap.CFRunLoopRunInMode")
+    @patch("nexus.via.tap.CFRunLoopGetCurrent", return_value="runloop")
+    @patch("nexus.via.tap.CFMachPortCreateRunLoopSource", return_value="source")
+    @patch("nexus.via.tap.CGEventTapEnable")
+    @patch("nexus.via.tap.CGEventTapCreate", return_value="port")
+    def test_loop_exit_releases_source_and_port(self, mock_create, mock_enable,
+                                                mock_src, mock_rl, mock_run,
+                                                mock_remove, mock_invalidate):
+        import threading
+        import nexus.via.tap as tap
+        _reset_recording()
+        tap._runloop_ready = threading.Event()
+        mock_run.side_effect = lambda *a: tap._stop_flag.set()
+        tap._tap_loop()
+        mock_enable.assert_called_with("port", False)
+        mock_remove.assert_called_once_with("runloop", "source", tap.kCFRunLoopDefaultMode)
+        mock_invalidate.assert_called_once_with("port")
+        assert tap._runloop is None
+        _reset_recording()
+
+    def test_disabled_tap_is_reenabled(self):
+        import nexus.via.tap as tap
+        _reset_recording()
+        tap._tap_port = "port"
+        try:
+            with patch("nexus.via.tap.CGEventTapEnable") as mock_enable:
+                for etype in (tap.kCGEventTapDisabledByTimeout,
+                              tap.kCGEventTapDisabledByUserInput):
+                    assert tap._on_event(None, etype, "event", None) == "event"
+            assert mock_enable.call_count == 2
+            mock_enable.assert_called_with("port", True)
+            assert tap.reenable_count() == 2
+            assert tap._pending.empty()
+        finally:
+            tap._tap_port = None
+            tap._tap_reenables = 0
+
+    def test_qos_unavailable_is_ignored(self):
+        import nexus.via.tap as tap
+        with patch("nexus.via.tap.ctypes.CDLL", side_effect=OSError("no libSystem")):
+            tap._raise_thread_qos()  # No exception
+
+
+class TestTapEnricher:
+
+    def setup_method(self):
+        _reset_recording()
+
+    def teardown_method(self):
+        _reset_recording()
+
+    @patch("nexus.via.tap._find_window_at",
+           return_value={"x": 100, "y": 50, "w": 800, "h": 600})
+    @patch("nexus.via.tap._hit_test_ax", return_value=("AXButton", "OK"))
+    def test_clicks_enriched_in_order(self, mock_ax, mock_win):
+        import nexus.via.tap as tap
+        tap._start_enricher()
+        tap._pending.put({"event_type": "key", "key_char": "a"})
+        tap._pending.put({"event_type": "click", "x": 500, "y": 350, "pid": 7})
+        tap._pending.put({"event_type": "scroll", "button": "down"})
+        events = tap.stop_tap()  # Joins the enricher after the queue drains
+        assert [e["event_type"] for e in events] == ["key", "click", "scroll"]
+        click = events[1]
+        assert click["ax_label"] == "OK"
+        assert click["rel_x"] == 0.5
+        assert click["rel_y"] == 0.5
+        mock_ax.assert_called_once_with(500, 350, pid=7)
+        assert tap._enricher is None
+
+    @patch("nexus.via.tap._find_window_at", return_value=None)
+    def test_stop_while_enricher_blocked(self, mock_win):
+        import threading
+        import nexus.via.tap as tap
+        release = threading.Event()
+
+        def slow_hit_test(x, y, pid=None):
+            release.wait(5.0)  # App not answering AX
+            return "AXButton", "OK"
+
+        with patch("nexus.via.tap._hit_test_ax", side_effect=slow_hit_test) as mock_ax, \
+                patch.object(tap, "_ENRICH_GRACE", 0.05):
+            tap._start_enricher()
+            for i in range(3):
+                tap._pending.put({"event_type": "click", "x": i, "y": 0, "pid": 7})
+            threading.Timer(0.2, release.set).start()
+            events = tap.stop_tap()
+
+        # Nothing lost or reordered; only the in-flight click waited on AX
+        assert [e["x"] for e in events] == [0, 1, 2]
+        assert events[0]["ax_label"] == "OK"
+        assert "ax_role" not in events[1] and "ax_role" not in events[2]
+        assert mock_ax.call_count == 1
+        assert tap._enricher is None
+        assert tap._pending.empty()
+
+    def test_drain_takes_snapshot_in_order(self):
+        import nexus.via.tap as tap
+        tap._event_buffer.extend({"event_type": "key", "key_code": i} for i in range(3))
+        assert [e["key_code"] for e in tap.drain_events()] == [0, 1, 2]
+        assert tap.drain_events() == []
+
+    def test_drain_survives_concurrent_drain(self):
+        import nexus.via.tap as tap
+        tap._event_buffer.extend({"event_type": "key", "key_code": i} for i in range(3))
+        real_popleft = tap._event_buffer.popleft
+        fake = MagicMock()
+        fake.__len__ = lambda s: 3
+        # stop_recording empties the buffer after our first pop
+        fake.popleft = MagicMock(side_effect=[real_popleft(), IndexError()])
+        with patch.object(tap, "_event_buffer", fake):
+            events = tap.drain_events()
+        assert [e["key_code"] for e in events] == [0]
+
+    @patch("nexus.via.tap._hit_test_ax", side_effect=RuntimeError("AX hung up"))
+    def test_enrichment_failure_keeps_event(self, mock_ax):
+        import nexus.via.tap as tap
+        tap._start_enricher()
+        tap._pending.put({"event_type": "click", "x": 1, "y": 2, "pid": 7})
+        events = tap.stop_tap()
+        assert len(events) == 1
+        assert "ax_role" not in events[0]
 
 
 # ===========================================================================
@@ -297,6 +521,32 @@ class TestRecordingStartStop:
         assert "1 clicks" in result.get("summary", "")
         assert "1 keys" in result.get("summary", "")
 
+    @patch("nexus.via.tap.stop_tap")
+    @patch("nexus.via.tap.start_tap", return_value=True)
+    def test_stop_filters_noise_and_truncates_preview(self, mock_start, mock_stop):
+        events = [{"event_type": "key", "key_char": str(i % 10)} for i in range(25)]
+        events.insert(3, {"ts_offset_ms": 5})  # no event_type: dropped
+        mock_stop.return_value = events
+        from nexus.mind import db
+        from nexus.via.recorder import start_recording, stop_recording
+        start_recording("typing")
+        result = stop_recording()
+        assert result["steps"] == 25
+        assert result["summary"] == "25 keys"
+        lines = result["steps_preview"].splitlines()
+        assert len(lines) == 21
+        assert lines[-1] == "  ... and 5 more"
+        steps = db.via_steps_for_route("typing")
+        assert [s["step_num"] for s in steps] == list(range(1, 26))
+
+    @patch("nexus.via.tap.reenable_count", return_value=2)
+    @patch("nexus.via.tap.stop_tap", return_value=[])
+    @patch("nexus.via.tap.start_tap", return_value=True)
+    def test_stop_reports_tap_reenables(self, mock_start, mock_stop, mock_count):
+        from nexus.via.recorder import start_recording, stop_recording
+        start_recording("flaky")
+        assert stop_recording()["tap_reenabled"] == 2
+
     def test_stop_without_start(self):
         from nexus.via.recorder import stop_recording
         result = stop_recording()
@@ -342,6 +592,29 @@ class TestRecordingStorage:
         assert steps[0]["rel_x"] == 0.5
         assert steps[0]["modifiers"] == {"cmd": False, "shift": False, "ctrl": False, "opt": False}
 
+    @patch("nexus.via.tap.stop_tap")
+    @patch("nexus.via.tap.start_tap", return_value=True)
+    def test_steps_written_in_one_commit(self, mock_start, mock_stop):
+        mock_stop.return_value = [
+            {"event_type": "key", "ts_offset_ms": i * 10, "key_char": "a"}
+            for i in range(50)
+        ]
+        from nexus.mind import db
+        from nexus.via.recorder import start_recording, stop_recording
+        start_recording("bulk")
+        conn = db._get_conn()
+        commits = []
+        conn.set_trace_callback(
+            lambda sql: commits.append(sql) if sql.upper().startswith("COMMIT") else None)
+        try:
+            stop_recording()
+        finally:
+            conn.set_trace_callback(None)
+        assert len(commits) == 1
+        steps = db.via_steps_for_route("bulk")
+        assert [s["step_num"] for s in steps] == list(range(1, 51))
+        assert steps[-1]["ts_offset_ms"] == 490
+
     @patch("nexus.via.tap.stop_tap", return_value=[])
     @patch("nexus.via.tap.start_tap", return_value=True)
     def test_list_recordings(self, mock_start, mock_stop):
@@ -388,6 +661,17 @@ class TestRecordingStorage:
         assert result["id"] == "test-2"
         stop_recording()
 
+    def test_unique_slug_single_query(self):
+        from nexus.mind import db
+        from nexus.via.recorder import _unique_slug
+        for rid in ("test", "test-2", "test-3", "testing", "test-extra"):
+            db.via_route_create(rid, rid)
+        assert db.via_route_ids_like("test") == {"test", "test-2", "test-3", "test-extra"}
+        with patch("nexus.mind.db.via_route_get") as mock_get:
+            assert _unique_slug("test") == "test-4"
+            assert _unique_slug("fresh") == "fresh"
+        mock_get.assert_not_called()
+
 
 # ===========================================================================
 # player.py — Route replay
@@ -397,7 +681,7 @@ class TestReplayClick:
 
     def test_tier1_ax_locator(self):
         """AX locator finds element → click at current position."""
-        from nexus.via.player import _replay_click
+        from nexus.via.player import Step, _replay_click
 
         step = {
             "ax_role": "AXButton", "ax_label": "Save",
@@ -409,14 +693,14 @@ class TestReplayClick:
 
         with patch("nexus.via.player._find_element_position", return_value=(500, 350)), \
              patch("nexus.via.player._do_click") as mock_click:
-            result = _replay_click(step)
+            result = _replay_click(Step.from_row(step))
             assert result["ok"] is True
             assert result["method"] == "ax_locator"
-            mock_click.assert_called_once_with(500, 350, "left", None)
+            mock_click.assert_called_once_with(500, 350, "left", None, sleep=time.sleep)
 
     def test_tier2_relative_coords(self):
         """AX locator fails → use relative coordinates."""
-        from nexus.via.player import _replay_click
+        from nexus.via.player import Step, _replay_click
 
         step = {
             "ax_role": "AXButton", "ax_label": "Save",
@@ -430,14 +714,14 @@ class TestReplayClick:
         with patch("nexus.via.player._find_element_position", return_value=None), \
              patch("nexus.via.player._relative_to_absolute", return_value=(500, 290)), \
              patch("nexus.via.player._do_click") as mock_click:
-            result = _replay_click(step)
+            result = _replay_click(Step.from_row(step))
             assert result["ok"] is True
             assert result["method"] == "relative_coords"
-            mock_click.assert_called_once_with(500, 290, "left", None)
+            mock_click.assert_called_once_with(500, 290, "left", None, sleep=time.sleep)
 
     def test_tier3_absolute_coords(self):
         """Both AX and relative fail → use absolute coordinates."""
-        from nexus.via.player import _replay_click
+        from nexus.via.player import Step, _replay_click
 
         step = {
             "ax_role": None, "ax_label": None,
@@ -449,14 +733,14 @@ class TestReplayClick:
 
         with patch("nexus.via.player._find_element_position", return_value=None), \
              patch("nexus.via.player._do_click") as mock_click:
-            result = _replay_click(step)
+            result = _replay_click(Step.from_row(step))
             assert result["ok"] is True
             assert result["method"] == "absolute_coords"
-            mock_click.assert_called_once_with(400, 300, "left", None)
+            mock_click.assert_called_once_with(400, 300, "left", None, sleep=time.sleep)
 
     def test_no_position_data(self):
         """No position data at all → error."""
-        from nexus.via.player import _replay_click
+        from nexus.via.player import Step, _replay_click
         step = {
             "ax_role": None, "ax_label": None,
             "rel_x": None, "rel_y": None,
@@ -464,58 +748,69 @@ class TestReplayClick:
             "button": "left", "modifiers": None,
         }
         with patch("nexus.via.player._find_element_position", return_value=None):
-            result = _replay_click(step)
+            result = _replay_click(Step.from_row(step))
             assert result["ok"] is False
 
 
 class TestReplayKey:
 
     def test_regular_key(self):
-        from nexus.via.player import _replay_key
+        from nexus.via.player import Step, _replay_key
         step = {"key_char": "a", "key_code": 0, "modifiers": {}}
         with patch("nexus.via.player.raw_input") as mock_input:
-            result = _replay_key(step)
+            result = _replay_key(Step.from_row(step))
             assert result["ok"] is True
             mock_input.type_text.assert_called_once_with("a")
 
     def test_shortcut_key(self):
-        from nexus.via.player import _replay_key
+        from nexus.via.player import Step, _replay_key
         step = {"key_char": "cmd+s", "key_code": 1, "modifiers": {"cmd": True, "shift": False, "ctrl": False, "opt": False}}
         with patch("nexus.via.player.raw_input") as mock_input:
-            result = _replay_key(step)
+            result = _replay_key(Step.from_row(step))
             assert result["ok"] is True
             assert result["method"] == "hotkey"
             mock_input.hotkey.assert_called_once_with("command", "s")
 
     def test_special_key(self):
-        from nexus.via.player import _replay_key
+        from nexus.via.player import Step, _replay_key
         step = {"key_char": "return", "key_code": 36, "modifiers": {}}
         with patch("nexus.via.player.raw_input") as mock_input:
-            result = _replay_key(step)
+            result = _replay_key(Step.from_row(step))
             assert result["ok"] is True
             mock_input.press_key.assert_called_once_with("return")
 
+    def test_null_columns_from_db(self):
+        """Rows from via_steps carry NULL modifiers/key_char for plain keys."""
+        from nexus.via.player import Step, _replay_key
+        step = Step.from_row({"id": 7, "route_id": "r", "step_num": 1, "event_type": "key",
+                              "ts_offset_ms": 0, "key_char": "a", "key_code": 0,
+                              "modifiers": None})
+        with patch("nexus.via.player.raw_input") as mock_input:
+            result = _replay_key(step)
+            assert result["ok"] is True
+            mock_input.type_text.assert_called_once_with("a")
+
     def test_no_key_data(self):
-        from nexus.via.player import _replay_key
-        result = _replay_key({"key_char": "", "key_code": None, "modifiers": {}})
+        from nexus.via.player import Step, _replay_key
+        result = _replay_key(Step(key_char="", key_code=None, modifiers={}))
         assert result["ok"] is False
 
 
 class TestReplayScroll:
 
     def test_scroll_down(self):
-        from nexus.via.player import _replay_scroll
+        from nexus.via.player import Step, _replay_scroll
         step = {"x": 400, "y": 300, "button": "down"}
         with patch("nexus.via.player.raw_input") as mock_input:
-            result = _replay_scroll(step)
+            result = _replay_scroll(Step.from_row(step))
             assert result["ok"] is True
             mock_input.scroll.assert_called_once_with(3, x=400, y=300)
 
     def test_scroll_up(self):
-        from nexus.via.player import _replay_scroll
+        from nexus.via.player import Step, _replay_scroll
         step = {"x": 400, "y": 300, "button": "up"}
         with patch("nexus.via.player.raw_input") as mock_input:
-            result = _replay_scroll(step)
+            result = _replay_scroll(Step.from_row(step))
             assert result["ok"] is True
             mock_input.scroll.assert_called_once_with(-3, x=400, y=300)
 
@@ -538,7 +833,7 @@ class TestRelativeToAbsolute:
                 "pid": 100, "app_name": "Finder",
                 "window_x": 100, "window_y": 50, "window_w": 800, "window_h": 600,
             }
-            result = player._relative_to_absolute(step, pid=100)
+            result = player._relative_to_absolute(player.Step.from_row(step), pid=100)
             assert result == (700, 380)  # 200 + 1000*0.5, 100 + 700*0.4
         finally:
             player.CGWindowListCopyWindowInfo = orig
@@ -554,38 +849,96 @@ class TestRelativeToAbsolute:
                 "pid": None, "app_name": None,
                 "window_x": 100, "window_y": 50, "window_w": 800, "window_h": 600,
             }
-            result = player._relative_to_absolute(step)
+            result = player._relative_to_absolute(player.Step.from_row(step))
             assert result == (500, 290)  # 100 + 800*0.5, 50 + 600*0.4
         finally:
             player.CGWindowListCopyWindowInfo = orig
 
+    def test_click_that_moves_window_affects_next_step(self):
+        from nexus.via import player
+        bounds = {"X": 0, "Y": 0, "Width": 1000, "Height": 500}
+        orig = player.CGWindowListCopyWindowInfo
+        try:
+            player.CGWindowListCopyWindowInfo = lambda *a, **kw: [{
+                "kCGWindowOwnerPID": 100,
+                "kCGWindowOwnerName": "Finder",
+                "kCGWindowBounds": dict(bounds),
+            }]
+            step = player.Step.from_row(
+                {"event_type": "click", "rel_x": 0.5, "rel_y": 0.5,
+                 "pid": 100, "app_name": "Finder"})
+            with patch("nexus.via.player.raw_input") as mock_input:
+                # The first click zooms the window
+                mock_input.click.side_effect = lambda x, y: bounds.update(
+                    X=100, Y=50, Width=1600, Height=900)
+                first = player._replay_click(step, sleep=player._no_sleep)
+                second = player._replay_click(step, sleep=player._no_sleep)
+            assert first["at"] == (500, 250)
+            assert second["at"] == (900, 500)  # 100 + 1600*0.5, 50 + 900*0.5
+        finally:
+            player.CGWindowListCopyWindowInfo = orig
+
+
+def _fake_find_first(elements):
+    """Stand-in for access.find_first over a flat element list."""
+    def find_first(match, pid=None, max_elements=150):
+        for el in elements:
+            if match(el["_ax_role"], el["label"]) and el.get("pos"):
+                return el
+        return None
+    return find_first
+
 
 class TestFindElementPosition:
 
     def test_finds_element(self):
         from nexus.via import player
-        orig = player.describe_app
+        orig = player.find_first
         try:
-            player.describe_app = lambda pid=None, max_elements=150: [
+            player.find_first = _fake_find_first([
                 {"_ax_role": "AXButton", "label": "Save", "pos": (400, 300), "size": (80, 30)},
                 {"_ax_role": "AXButton", "label": "Cancel", "pos": (300, 300), "size": (80, 30)},
-            ]
+            ])
             result = player._find_element_position("AXButton", "Save", pid=100)
             assert result == (440, 315)  # center: 400+80/2, 300+30/2
         finally:
-            player.describe_app = orig
+            player.find_first = orig
 
     def test_element_not_found(self):
         from nexus.via import player
-        orig = player.describe_app
+        orig = player.find_first
         try:
-            player.describe_app = lambda pid=None, max_elements=150: [
+            player.find_first = _fake_find_first([
                 {"_ax_role": "AXButton", "label": "Cancel", "pos": (300, 300), "size": (80, 30)},
-            ]
+            ])
             result = player._find_element_position("AXButton", "Save", pid=100)
             assert result is None
         finally:
-            player.describe_app = orig
+            player.find_first = orig
+
+
+class TestSystemDialogThrottle:
+
+    def setup_method(self):
+        from nexus.via import player
+        player._force_dialog_check()
+
+    def test_scans_at_most_every_interval(self):
+        from nexus.via import player
+        with patch("nexus.via.player.detect_system_dialogs", return_value=[]) as mock_detect:
+            player._handle_system_dialog()
+            player._handle_system_dialog()
+            assert mock_detect.call_count == 1
+
+    def test_click_forces_next_scan(self):
+        from nexus.via import player
+        with patch("nexus.via.player.detect_system_dialogs", return_value=[]) as mock_detect, \
+             patch("nexus.via.player.raw_input"), \
+             patch("nexus.via.player.time"):
+            player._handle_system_dialog()
+            player._do_click(10, 10)
+            player._handle_system_dialog()
+            assert mock_detect.call_count == 2
 
 
 class TestFullReplay:
@@ -634,6 +987,7 @@ class TestFullReplay:
              patch("nexus.via.player.time") as mock_time:
             mock_time.sleep = MagicMock()
             mock_time.time = time.time
+            mock_time.monotonic = time.monotonic
             result = replay("test", speed=0)
 
         assert result["ok"] is True
@@ -655,12 +1009,90 @@ class TestFullReplay:
              patch("nexus.via.player.time") as mock_time:
             mock_time.sleep = MagicMock()
             mock_time.time = time.time
+            mock_time.monotonic = time.monotonic
             result = replay("fail", speed=0)
 
         assert result["ok"] is False
         assert result["completed"] == 1
         assert result["total"] == 2
 
+    def test_replay_zero_speed_never_sleeps(self):
+        from nexus.mind import db
+        db.via_route_create("fast", "Fast Route")
+        db.via_step_insert("fast", 1, 0.0, "click", x=100, y=100, button="left")
+        db.via_step_insert("fast", 2, 800.0, "click", x=200, y=200, button="left")
+
+        from nexus.via.player import replay
+        with patch("nexus.via.player._replay_click", return_value={"ok": True, "method": "absolute_coords"}), \
+             patch("nexus.via.player._handle_system_dialog"), \
+             patch("nexus.via.player.time") as mock_time:
+            mock_time.sleep = MagicMock()
+            mock_time.monotonic = time.monotonic
+            result = replay("fast", speed=0)
+
+        assert result["ok"] is True
+        mock_time.sleep.assert_not_called()
+
+    def test_replay_zero_speed_skips_click_settle(self):
+        """speed=0 also drops the pre-click pause inside _do_click."""
+        from nexus.mind import db
+        db.via_route_create("instant", "Instant Route")
+        db.via_step_insert("instant", 1, 0.0, "click", x=100, y=100, button="left")
+        db.via_step_insert("instant", 2, 50.0, "click", x=200, y=200, button="left")
+
+        from nexus.via.player import replay
+        with patch("nexus.via.player.raw_input") as mock_input, \
+             patch("nexus.via.player._handle_system_dialog"), \
+             patch("nexus.via.player.time") as mock_time:
+            mock_time.sleep = MagicMock()
+            mock_time.monotonic = time.monotonic
+            result = replay("instant", speed=0)
+
+        assert result["ok"] is True
+        assert mock_input.click.call_count == 2
+        mock_time.sleep.assert_not_called()
+
+    def test_replay_delay_absorbs_settle(self):
+        """Recorded gap and settle overlap — one sleep per gap, not two."""
+        from nexus.mind import db
+        db.via_route_create("timed", "Timed Route")
+        db.via_step_insert("timed", 1, 0.0, "click", x=100, y=100, button="left")
+        db.via_step_insert("timed", 2, 200.0, "click", x=200, y=200, button="left")
+
+        from nexus.via.player import replay
+        with patch("nexus.via.player._replay_click", return_value={"ok": True, "method": "absolute_coords"}), \
+             patch("nexus.via.player._handle_system_dialog"), \
+             patch("nexus.via.player.time") as mock_time:
+            mock_time.sleep = MagicMock()
+            mock_time.monotonic = time.monotonic
+            result = replay("timed", speed=1.0)
+
+        assert result["ok"] is True
+        assert mock_time.sleep.call_count == 1
+        assert 0 < mock_time.sleep.call_args[0][0] <= 0.2
+
+
+# ===========================================================================
+# __init__.py — lazy package exports
+# ===========================================================================
+
+class TestViaPackageExports:
+
+    def test_lazy_export_resolves(self):
+        import nexus.via as via
+        from nexus.via.router import route
+        assert via.route is route
+
+    def test_all_lists_public_api(self):
+        import nexus.via as via
+        assert "replay" in via.__all__
+        assert "start_recording" in via.__all__
+
+    def test_unknown_attribute_raises(self):
+        import nexus.via as via
+        with pytest.raises(AttributeError):
+            via.no_such_thing
+
 
 # ===========================================================================
 # resolve.py — Via intent routing
@@ -804,6 +1236,29 @@ class TestViaDB:
         assert steps[1]["event_type"] == "key"
         assert steps[1]["key_char"] == "return"
 
+    def test_insert_many_matches_single_insert(self):
+        from nexus.mind import db
+        step = {
+            "ts_offset_ms": 250.0, "event_type": "click",
+            "x": 400, "y": 300, "rel_x": 0.5, "rel_y": 0.4,
+            "window_x": 100, "window_y": 50, "window_w": 800, "window_h": 600,
+            "button": "left", "modifiers": {"cmd": True},
+            "ax_role": "AXButton", "ax_label": "OK",
+            "pid": 100, "app_name": "Finder",
+        }
+        db.via_route_create("one", "Single")
+        db.via_route_create("many", "Many")
+        db.via_step_insert("one", 1, **step)
+        assert db.via_steps_insert_many("many", [step]) == 1
+
+        def row(route_id):
+            r = dict(db.via_steps_for_route(route_id)[0])
+            r.pop("id", None)
+            r.pop("route_id")
+            return r
+
+        assert row("one") == row("many")
+
     def test_cascade_delete(self):
         from nexus.mind import db
         db.via_route_create("cascade", "Cascade Test")